@@ -0,0 +1,95 @@
+"""Pluggable backends for the scalar-loop kernels.
+
+Kernels are registered once with their pure Python/NumPy reference implementation.
+The "numba" backend JIT-compiles that same function (lazily, on first use, with an
+on-disk compilation cache), so both backends run the identical algorithm with the
+identical floating-point operations. The "python" backend calls the reference directly.
+
+Select the backend with THERMAL_SIM_BACKEND=auto|python|numba or `set_backend()`;
+"auto" (the default) uses numba when it is installed.
+"""
+import importlib.util
+import os
+import threading
+
+import numpy as np
+
+# Optional dependency, only imported when a kernel is first compiled: importing
+# numba costs a few hundred milliseconds of startup even if nothing is JIT-compiled
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+BACKENDS = ("python", "numba")
+
+_kernels = {}    # name -> (reference function, scalar argument positions, jit options)
+_compiled = {}   # name -> numba dispatcher
+_compile_lock = threading.Lock()
+
+
+def available() -> tuple:
+    """Backends usable in this environment."""
+    return BACKENDS if HAS_NUMBA else ("python",)
+
+
+def _resolve(name: str) -> str:
+    if name == "auto":
+        return "numba" if HAS_NUMBA else "python"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}' (expected auto or one of {BACKENDS})")
+    if name == "numba" and not HAS_NUMBA:
+        raise ValueError("The numba backend requires the 'numba' package (pip install numba)")
+    return name
+
+
+_active = _resolve(os.environ.get("THERMAL_SIM_BACKEND", "auto"))
+
+
+def set_backend(name: str) -> None:
+    """Select the active backend: 'auto', 'python' or 'numba'."""
+    global _active
+    _active = _resolve(name)
+
+
+def active() -> str:
+    """Name of the active backend."""
+    return _active
+
+
+def register(name: str, func, scalar_args=(), **jit_options) -> None:
+    """Register the reference implementation of a kernel.
+
+    Args:
+        name: kernel name used with `call()`
+        func: pure Python/NumPy reference implementation (must also be numba-compilable)
+        scalar_args: positions of arguments that numba only supports as scalars;
+            calls with array values there use the reference implementation
+        jit_options: extra options for numba.njit (e.g. error_model="numpy")
+    """
+    _kernels[name] = (func, tuple(scalar_args), jit_options)
+    _compiled.pop(name, None)
+
+
+def call(name: str, *args):
+    """Run a registered kernel with the active backend."""
+    func, scalar_args, jit_options = _kernels[name]
+
+    if _active == "python" or any(np.ndim(args[i]) != 0 for i in scalar_args):
+        return func(*args)
+
+    # numba needs homogeneous float arrays instead of Python lists
+    args = tuple(
+        float(a) if np.ndim(a) == 0 else np.ascontiguousarray(a, dtype=np.float64)
+        for a in args
+    )
+    return _jit(name, func, jit_options)(*args)
+
+
+def _jit(name, func, jit_options):
+    dispatcher = _compiled.get(name)
+    if dispatcher is None:
+        with _compile_lock:
+            dispatcher = _compiled.get(name)
+            if dispatcher is None:
+                import numba
+                dispatcher = numba.njit(cache=True, **jit_options)(func)
+                _compiled[name] = dispatcher
+    return dispatcher
@@ -0,0 +1,327 @@
+"""Headless batch runner for interpolation, differentiation and integration jobs.
+
+Reads jobs from a JSON Lines (.jsonl) or CSV (.csv) file, runs them on a process pool
+with chunked scheduling and streams one JSON result per job to the output (JSON Lines).
+A failing job produces an error record and never stops the batch.
+
+Usage (run from project root):
+
+    python batch.py jobs.jsonl -o results.jsonl --workers 8 --chunksize 64
+
+Job fields (JSON keys or CSV columns):
+- method: newton | lagrange | forward | backward | central | exact | trapezoid | simpson | cooling
+- id: optional job identifier (defaults to the job's position in the file)
+- interpolation: x, y (data) and at (one value or a list of values)
+- differentiation: f (SymPy formula in x), at, h; method exact evaluates the symbolic
+  derivative instead (no h needed, at may be a list evaluated in one vectorized call)
+- integration: either x, y (data points) or f, a, b and h (step) or n (subintervals)
+- cooling: x, y (time and temperature data) or file (CSV/NPY/NPZ data file, see
+  dataio.py); reports the cooling constant k and the ambient temperature
+- exact: if true and f is given, also report the symbolic result and the errors
+- plot: if true, save a plot of the job (see plotting.py) and report its path
+
+Every result also reports how many times f was evaluated and on how many points;
+--metrics FILE additionally appends the per-job counters and timings to FILE.
+
+In CSV files list values (x, y, at) are separated by ';' or spaces.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import sympy as sp
+
+import cooling
+import derivatives
+import differentiation as diff
+import integration as integ
+import instrumentation
+import interpolation as interp
+import memo
+import plotting
+import utils
+
+INTERPOLATION_METHODS = {
+    "newton": interp.newton_interpolation,
+    "lagrange": interp.lagrange_interpolation,
+}
+DIFFERENCE_METHODS = {
+    "forward": diff.forward_difference,
+    "backward": diff.backward_difference,
+    "central": diff.central_difference,
+}
+INTEGRATION_METHODS = {
+    "trapezoid": (integ.trapezoidal_rule, integ.trapezoidal_from_points),
+    "simpson": (integ.simpsons_rule, integ.simpsons_from_points),
+}
+METHODS = (tuple(INTERPOLATION_METHODS) + tuple(DIFFERENCE_METHODS) + ("exact",)
+           + tuple(INTEGRATION_METHODS) + ("cooling",))
+
+LIST_FIELDS = ("x", "y", "at")
+NUMBER_FIELDS = ("at", "h", "a", "b", "n")
+
+
+# =====================================================
+# JOB EXECUTION (runs inside worker processes)
+# =====================================================
+
+X_SYMBOL = derivatives.X_SYMBOL
+
+
+@lru_cache(maxsize=256)
+def _compile_model(f_str: str):
+    """Parse a SymPy-syntax model once per worker process (memoized, see memo.py)."""
+    f_expr = derivatives.parse(f_str)
+    return f_expr, memo.shared(f_expr)
+
+
+def _floats(values) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _interpolation_job(job, method):
+    X = _floats(job["x"]).tolist()
+    Y = _floats(job["y"]).tolist()
+    if len(X) != len(Y):
+        raise ValueError("x and y must have the same length")
+    if len(set(X)) != len(X):
+        raise ValueError("x values must be distinct")
+
+    at = job["at"]
+    if isinstance(at, list):
+        result = [float(method(float(a), X, Y)) for a in at]
+    else:
+        result = float(method(float(at), X, Y))
+
+    record = {"result": result}
+    if job.get("plot"):
+        record["plot"] = interp.plot(X, Y, method)
+    return record
+
+
+def _difference_job(job, method):
+    f_expr, f_np = _compile_model(job["f"])
+    x = float(job["at"])
+    h = float(job["h"])
+
+    record = {"result": float(method(f_np, x, h))}
+    if job.get("exact"):
+        exact = float(derivatives.compile_derivative(f_expr)(x))
+        record.update(_errors(record["result"], exact))
+    if job.get("plot"):
+        record["plot"] = diff.plot(f_np, x, h, method, exact=derivatives.compile_derivative(f_expr))
+    return record
+
+
+def _exact_derivative_job(job):
+    f_expr, f_np = _compile_model(job["f"])
+    df = derivatives.compile_derivative(f_expr)
+
+    at = job["at"]
+    if isinstance(at, list):
+        result = _floats(df(_floats(at))).tolist()
+    else:
+        result = float(df(float(at)))
+
+    record = {"result": result}
+    if job.get("plot"):
+        x = float(at[0] if isinstance(at, list) else at)
+        h = float(job.get("h", 0.01))
+        record["plot"] = diff.plot(f_np, x, h, derivatives.exact_method(df), exact=df)
+    return record
+
+
+def _integration_job(job, rule, rule_from_points, method_name):
+    if "f" not in job:
+        x = _floats(job["x"])
+        y = _floats(job["y"])
+        record = {"result": rule_from_points(x, y)}
+        if job.get("plot"):
+            record["plot"] = integ.plot(x, y, method_name=method_name)
+        return record
+
+    f_expr, f_np = _compile_model(job["f"])
+    a = float(job["a"])
+    b = float(job["b"])
+    if "n" in job:
+        N = int(job["n"])
+        h = (b - a) / N
+    else:
+        h = float(job["h"])
+        N = integ.n_from_step(a, b, h)
+
+    record = {"result": rule(f_np, a, b, N), "n": N}
+    if job.get("exact"):
+        exact = float(sp.N(sp.integrate(f_expr, (X_SYMBOL, a, b))))
+        record.update(_errors(record["result"], exact))
+    if job.get("plot"):
+        record["plot"] = integ.plot(f_np, a, b, h, method_name=method_name)
+    return record
+
+
+def _cooling_job(job):
+    if "file" in job:
+        estimator = cooling.estimate_file(job["file"])
+    else:
+        t = _floats(job["x"])
+        order = np.argsort(t)
+        estimator = cooling.estimate(t[order], _floats(job["y"])[order])
+    return {
+        "result": {"k": estimator.k, "ambient": estimator.ambient},
+        "r_squared": estimator.r_squared,
+        "samples": estimator.samples,
+    }
+
+
+def _errors(approx, exact):
+    return {
+        "exact": exact,
+        "absolute_error": utils.absolute_error(approx, exact),
+        "relative_error": utils.relative_error(approx, exact) if exact != 0 else None,
+    }
+
+
+def run_job(job: dict) -> dict:
+    """Run one job and return its result record. Never raises."""
+    method = job.get("method")
+    record = {"id": job.get("id"), "method": method}
+
+    t0 = time.perf_counter()
+    with instrumentation.collect(f"{record['id']}:{method}") as metrics:
+        try:
+            if method in INTERPOLATION_METHODS:
+                record.update(_interpolation_job(job, INTERPOLATION_METHODS[method]))
+            elif method in DIFFERENCE_METHODS:
+                record.update(_difference_job(job, DIFFERENCE_METHODS[method]))
+            elif method == "exact":
+                record.update(_exact_derivative_job(job))
+            elif method in INTEGRATION_METHODS:
+                rule, rule_from_points = INTEGRATION_METHODS[method]
+                record.update(_integration_job(job, rule, rule_from_points, method))
+            elif method == "cooling":
+                record.update(_cooling_job(job))
+            else:
+                raise ValueError(f"Unknown method '{method}' (expected one of {', '.join(METHODS)})")
+            record["ok"] = True
+        except Exception as e:
+            record["ok"] = False
+            record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = time.perf_counter() - t0
+    record["evaluations"] = metrics.evaluations
+    record["points"] = metrics.points
+
+    return record
+
+
+def _init_worker(plot_dir, plot_format, metrics_file):
+    plotting.set_backend("file", output_dir=plot_dir, fmt=plot_format)
+    instrumentation.config["metrics_file"] = metrics_file
+
+
+# =====================================================
+# JOB INPUT
+# =====================================================
+
+def _parse_csv_value(field, text):
+    text = text.strip()
+    if text == "":
+        return None
+    if field in LIST_FIELDS and (";" in text or " " in text):
+        return [float(v) for v in text.replace(";", " ").split()]
+    if field in LIST_FIELDS and field != "at":
+        return [float(text)]
+    if field in NUMBER_FIELDS:
+        return float(text)
+    if field in ("exact", "plot"):
+        return text.lower() in ("1", "true", "yes")
+    return text
+
+
+def read_jobs(path):
+    """Yield job dicts from a .jsonl or .csv file, assigning default ids."""
+    path = Path(path)
+
+    with open(path, newline="", encoding="utf-8") as fh:
+        if path.suffix.lower() == ".csv":
+            for i, row in enumerate(csv.DictReader(fh)):
+                job = {}
+                try:
+                    if None in row:  # DictReader puts cells beyond the header under None
+                        raise ValueError(f"row has {len(row[None])} more cell(s) than the header")
+                    for field, text in row.items():
+                        value = _parse_csv_value(field, text or "")
+                        if value is not None:
+                            job[field] = value
+                except Exception as e:
+                    # Isolate bad rows as failed jobs instead of aborting the batch
+                    job = {"id": (row.get("id") or "").strip() or i, "method": None, "_parse_error": str(e)}
+                job.setdefault("id", i)
+                yield job
+            return
+
+        lines = (line.strip() for line in fh)
+        for i, line in enumerate(line for line in lines if line):
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("a job must be a JSON object")
+            except ValueError as e:
+                # Isolate malformed lines as failed jobs instead of aborting the batch
+                job = {"id": i, "method": None, "_parse_error": str(e)}
+            job.setdefault("id", i)
+            yield job
+
+
+def _run_or_report(job):
+    if "_parse_error" in job:
+        return {"id": job["id"], "method": None, "ok": False,
+                "error": f"Invalid job: {job['_parse_error']}", "seconds": 0.0}
+    return run_job(job)
+
+
+# =====================================================
+# CLI
+# =====================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run numerical-method jobs in parallel without the TUI.")
+    parser.add_argument("jobs", help="Job file (.jsonl or .csv)")
+    parser.add_argument("-o", "--output", help="Output JSON Lines file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=32, help="Jobs sent to a worker at a time")
+    parser.add_argument("--unordered", action="store_true", help="Emit results as soon as they finish")
+    parser.add_argument("--plot-dir", default="plots", help="Directory for plots of jobs with plot=true")
+    parser.add_argument("--plot-format", default="png", choices=plotting.FORMATS)
+    parser.add_argument("--metrics", help="Append per-job evaluation counts and timings to this JSON Lines file")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    ok = failed = 0
+    t0 = time.perf_counter()
+
+    try:
+        with multiprocessing.Pool(args.workers, initializer=_init_worker,
+                                  initargs=(args.plot_dir, args.plot_format, args.metrics)) as pool:
+            mapper = pool.imap_unordered if args.unordered else pool.imap
+            for record in mapper(_run_or_report, read_jobs(args.jobs), chunksize=args.chunksize):
+                out.write(json.dumps(record) + "\n")
+                if record["ok"]:
+                    ok += 1
+                else:
+                    failed += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{ok + failed} jobs in {time.perf_counter() - t0:.2f}s: {ok} ok, {failed} failed", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
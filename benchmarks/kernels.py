@@ -0,0 +1,227 @@
+"""Benchmark suite for the numerical kernels with regression thresholds.
+
+For every kernel and problem size (10 to 10^7 points, capped per kernel where the
+algorithm is quadratic) it reports the best time per call, throughput in points per
+second and peak memory measured with tracemalloc.
+
+Usage (run from project root):
+
+    python benchmarks/kernels.py                       # run and compare with stored baselines
+    python benchmarks/kernels.py --save-baseline       # (re)record baselines on this machine
+    python benchmarks/kernels.py --kernels simpson --max-size 1e6 --tolerance 0.3
+    python benchmarks/kernels.py --backend python --baseline python_baselines.json
+    python benchmarks/kernels.py --check               # CI: a missing baseline is an error
+
+Baselines are machine specific, so none is committed; they are stored in
+benchmarks/kernel_baselines.json. The script exits with status 1 when a kernel is
+slower (or uses more memory) than its baseline by more than the tolerance. With
+--check it also exits with status 2 when the baseline file is missing or lacks an
+entry for a measured kernel and size, so the regression gate cannot pass vacuously.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import backends
+import differentiation as diff
+import integration as integ
+import interpolation as interp
+
+BASELINE_PATH = Path(__file__).resolve().parent / "kernel_baselines.json"
+SIZES = [10 ** k for k in range(1, 8)]
+
+
+# =====================================================
+# KERNEL SETUPS
+# =====================================================
+# Each setup(n) returns a zero-argument callable that runs the kernel once on n points.
+
+def _data(n):
+    x = np.linspace(0.0, 10.0, n)
+    return x, 20.0 + 70.0 * np.exp(-0.1 * x)
+
+
+def _interp_data(n):
+    # Chebyshev-like nodes keep high-degree divided differences finite
+    x = 5.0 + 5.0 * np.cos(np.linspace(0.0, np.pi, n))[::-1]
+    return x, 20.0 + 70.0 * np.exp(-0.1 * x)
+
+
+def setup_divided_differences(n):
+    X, Y = _interp_data(n)
+    return lambda: interp.divided_differences(X, Y)
+
+
+def setup_newton(n):
+    X, Y = _interp_data(n)
+    return lambda: interp.newton_interpolation(4.321, X, Y)
+
+
+def setup_lagrange(n):
+    X, Y = _interp_data(n)
+    return lambda: interp.lagrange_interpolation(4.321, X, Y)
+
+
+def _setup_difference(method):
+    def setup(n):
+        x = np.linspace(0.0, 10.0, n)
+        return lambda: method(np.sin, x, 1e-3)
+    return setup
+
+
+def _setup_rule(rule):
+    def setup(n):
+        N = n - 1 if (n - 1) % 2 == 0 else n - 2
+        return lambda: rule(np.sin, 0.0, 10.0, N)
+    return setup
+
+
+def _setup_from_points(rule):
+    def setup(n):
+        n = n if n % 2 == 1 else n + 1  # Simpson needs an odd number of points
+        x, y = _data(n)
+        return lambda: rule(x, y)
+    return setup
+
+
+# name -> (setup, largest size); quadratic Python loops are capped
+KERNELS = {
+    "divided_differences": (setup_divided_differences, 10 ** 3),
+    "newton_interpolation": (setup_newton, 10 ** 3),
+    "lagrange_interpolation": (setup_lagrange, 10 ** 3),
+    "forward_difference": (_setup_difference(diff.forward_difference), 10 ** 7),
+    "backward_difference": (_setup_difference(diff.backward_difference), 10 ** 7),
+    "central_difference": (_setup_difference(diff.central_difference), 10 ** 7),
+    "trapezoidal_rule": (_setup_rule(integ.trapezoidal_rule), 10 ** 7),
+    "simpsons_rule": (_setup_rule(integ.simpsons_rule), 10 ** 7),
+    "trapezoidal_from_points": (_setup_from_points(integ.trapezoidal_from_points), 10 ** 7),
+    "simpsons_from_points": (_setup_from_points(integ.simpsons_from_points), 10 ** 7),
+}
+
+
+# =====================================================
+# MEASUREMENT
+# =====================================================
+
+def measure(func, min_time=0.2, max_repeats=1000):
+    """Best wall time per call over repeated runs, and peak traced memory of one call."""
+    func()  # warm-up (JIT compilation, caches)
+
+    best = float("inf")
+    total = 0.0
+    repeats = 0
+    while repeats < max_repeats and (total < min_time or repeats < 3):
+        t0 = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        total += elapsed
+        repeats += 1
+        if elapsed > min_time:
+            break
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak, repeats
+
+
+def run(kernels, max_size):
+    results = {}
+    for name in kernels:
+        setup, cap = KERNELS[name]
+        for n in SIZES:
+            if n > min(cap, max_size):
+                break
+            # High-degree Lagrange products overflow; only the timing matters here
+            with np.errstate(all="ignore"):
+                seconds, peak, repeats = measure(setup(n))
+            results[f"{name}@{n}"] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{name:<26}{n:>10,}{seconds * 1e3:>12.3f} ms{n / seconds:>16,.0f} pts/s"
+                  f"{peak / 2 ** 20:>10.2f} MiB  ({repeats} runs)")
+    return results
+
+
+def compare(results, baselines, tolerance, memory_tolerance, min_delta):
+    failures = []
+    for key, result in results.items():
+        base = baselines.get(key)
+        if base is None:
+            continue
+        slower = result["seconds"] - base["seconds"]
+        # Microsecond-scale timings are noisy: also require an absolute slowdown
+        if result["seconds"] > base["seconds"] * (1.0 + tolerance) and slower > min_delta:
+            failures.append(f"{key}: {result['seconds'] * 1e3:.3f} ms vs baseline "
+                            f"{base['seconds'] * 1e3:.3f} ms (+{result['seconds'] / base['seconds'] - 1:.0%})")
+        if result["peak_bytes"] > base["peak_bytes"] * (1.0 + memory_tolerance) + 4096:
+            failures.append(f"{key}: peak {result['peak_bytes']:,} B vs baseline {base['peak_bytes']:,} B")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the numerical kernels.")
+    parser.add_argument("--kernels", nargs="*", help="Kernel names (substring match); default all")
+    parser.add_argument("--max-size", type=float, default=1e7, help="Largest problem size")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="Allowed peak memory growth")
+    parser.add_argument("--min-delta", type=float, default=2e-5, help="Ignore slowdowns below this many seconds")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail (exit status 2) when the baseline is missing or incomplete")
+    parser.add_argument("--backend", default="auto", help="Kernel backend: auto, python or numba (see backends.py)")
+    args = parser.parse_args()
+
+    backends.set_backend(args.backend)
+    print(f"Kernel backend: {backends.active()}")
+
+    names = [k for k in KERNELS if not args.kernels or any(s in k for s in args.kernels)]
+    if not names:
+        parser.error(f"No kernel matches {args.kernels}; available: {', '.join(KERNELS)}")
+
+    print(f"{'kernel':<26}{'points':>10}{'time/call':>15}{'throughput':>22}{'peak':>14}")
+    results = run(names, int(args.max_size))
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    if args.save_baseline:
+        baselines.update(results)
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True))
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    missing = [key for key in results if key not in baselines]
+    if args.check and missing:
+        print(f"\n❌ No baseline for {len(missing)} of {len(results)} measurement(s) in {baseline_path} "
+              f"(e.g. {missing[0]}); record one with --save-baseline on this machine.")
+        return 2
+    if not baselines:
+        print("\nNo baseline found; run with --save-baseline to record one.")
+        return 0
+
+    failures = compare(results, baselines, args.tolerance, args.memory_tolerance, args.min_delta)
+    if failures:
+        print("\n❌ Regressions beyond tolerance:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n✅ No regressions beyond tolerance.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
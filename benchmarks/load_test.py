@@ -0,0 +1,162 @@
+"""Load test for the served mode's shared compute pool (compute.py).
+
+Simulates N concurrent browser sessions, each with its own connection and session
+id, sending a mix of the heavy jobs the screens offload (exact integrals, divided
+differences, Lagrange evaluation). Reports latency percentiles overall and per job
+kind, the spread of per-session median latencies (fairness), throughput and the
+number of jobs rejected by the per-session queue limit.
+
+Usage (run from project root):
+
+    python benchmarks/load_test.py                              # local pool, 8 sessions
+    python benchmarks/load_test.py --sessions 32 --requests 20 --workers 4 --think 0.05
+    python benchmarks/load_test.py --address 127.0.0.1:5000 --authkey <key>   # running server
+
+By default the script starts its own pool (sized like serve.py's) on a local socket.
+"""
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import compute
+import derivatives
+import interpolation as interp
+
+MODELS = [
+    "70*exp(-0.1*x) + 20",
+    "x**2*exp(-x)",
+    "sin(x)**2 + cos(3*x)",
+    "50/(1 + x**2)",
+    "x*log(1 + x)",
+    "exp(-x)*cos(x)",
+]
+
+
+# =====================================================
+# WORKLOAD
+# =====================================================
+
+def _job(rng):
+    """Random (kind, func, args) in the mix the screens send."""
+    kind = rng.choice(["integral", "newton", "lagrange"], p=[0.4, 0.3, 0.3])
+    if kind == "integral":
+        a = float(rng.uniform(0, 2))
+        return kind, derivatives.integrate, (str(rng.choice(MODELS)), a, a + float(rng.uniform(1, 5)))
+
+    X = np.sort(rng.uniform(0, 10, 300 if kind == "newton" else 2000))
+    Y = 70 * np.exp(-0.1 * X) + 20
+    if kind == "newton":
+        return kind, interp.divided_differences, (X, Y)
+    return kind, interp.lagrange_interpolation, (float(rng.uniform(0, 10)), X, Y)
+
+
+def _session(index, args, address, authkey, results):
+    rng = np.random.default_rng(args.seed + index)
+    client = compute.Client(address, authkey, session=f"load-{index}")
+    try:
+        for _ in range(args.requests):
+            kind, func, job_args = _job(rng)
+            t0 = time.perf_counter()
+            try:
+                client.call(func, *job_args)
+                status = "ok"
+            except RuntimeError:
+                status = "rejected"
+            results.append((index, kind, status, time.perf_counter() - t0))
+            if args.think:
+                time.sleep(rng.exponential(args.think))
+    finally:
+        client.close()
+
+
+def run(args, address, authkey):
+    results = []  # (session, kind, status, latency); list.append is thread-safe
+    threads = [
+        threading.Thread(target=_session, args=(i, args, address, authkey, results))
+        for i in range(args.sessions)
+    ]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - t0
+
+
+# =====================================================
+# REPORTING
+# =====================================================
+
+def _percentiles(latencies):
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return p50, p90, p99, np.max(latencies)
+
+
+def report(results, wall):
+    ok = [r for r in results if r[2] == "ok"]
+    rejected = len(results) - len(ok)
+    if not ok:
+        print("No job completed.")
+        return
+
+    print(f"=== Latency (ms) over {len(ok)} jobs ===")
+    print(f"{'kind':<12} {'count':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for kind in ["all", "integral", "newton", "lagrange"]:
+        latencies = [r[3] for r in ok if kind == "all" or r[1] == kind]
+        if latencies:
+            values = " ".join(f"{v * 1000:9.1f}" for v in _percentiles(latencies))
+            print(f"{kind:<12} {len(latencies):>6} {values}")
+
+    medians = [
+        np.median([r[3] for r in ok if r[0] == session])
+        for session in sorted({r[0] for r in ok})
+    ]
+    print("\n=== Fairness: per-session median latency (ms) ===")
+    print(f"min {min(medians) * 1000:.1f}   median {np.median(medians) * 1000:.1f}   "
+          f"max {max(medians) * 1000:.1f}   max/min {max(medians) / min(medians):.2f}")
+
+    print(f"\nThroughput: {len(ok) / wall:.1f} jobs/s over {wall:.2f} s")
+    print(f"Rejected (queue limit): {rejected}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the shared compute pool with concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent sessions")
+    parser.add_argument("--requests", type=int, default=10, help="Jobs per session")
+    parser.add_argument("--workers", type=int, default=None, help="Pool processes when starting a local pool")
+    parser.add_argument("--queue-limit", type=int, default=16, help="Per-session queue limit of the local pool")
+    parser.add_argument("--think", type=float, default=0.0, help="Mean pause between a session's jobs (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--address", help="host:port of a running pool (default: start a local one)")
+    parser.add_argument("--authkey", default="", help="Authentication key of the running pool")
+    args = parser.parse_args()
+
+    pool = listener = None
+    address, authkey = args.address, args.authkey
+    if address is None:
+        pool = compute.ComputePool(args.workers, args.queue_limit)
+        listener = compute.serve(pool)
+        host, port = listener.address
+        address = f"{host}:{port}"
+        print(f"Local pool: {pool.workers} worker(s) at {address}")
+
+    try:
+        results, wall = run(args, address, authkey)
+    finally:
+        if listener is not None:
+            listener.close()
+            pool.shutdown()
+
+    report(results, wall)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
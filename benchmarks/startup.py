@@ -0,0 +1,253 @@
+"""Startup and import-time benchmark for the Textual app (screens/main.py).
+
+Measures, in headless mode (Textual's test pilot):
+- cold process startup (no cached bytecode) to first paint,
+- warm process startup (bytecode cached) to first paint,
+- time to push and paint each screen,
+- a `-X importtime` breakdown of the heaviest modules.
+
+Usage (run from project root):
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 5 --budget cold=3.0 --budget warm=1.5 --budget screen=0.3
+    python benchmarks/startup.py --budgets budgets.json   # e.g. {"cold": 3.0, "warm": 1.5, "screen": 0.3}
+
+Budgets are in seconds. The script exits with status 1 when any budget is exceeded.
+Child processes always write bytecode (PYTHONDONTWRITEBYTECODE is dropped), so
+warm runs really start from a primed cache.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCREENS_DIR = ROOT / "screens"
+
+# (label, module attribute on main, class name)
+SCREENS = [
+    ("interpolation", "interp_screen", "InterpolationScreen"),
+    ("differentiation", "diff_screen", "DifferentiationScreen"),
+    ("integration", "integ_screen", "IntegrationScreen"),
+    ("error", "error_screen", "ErrorScreen"),
+    ("profile", "profile_screen", "ProfileScreen"),
+]
+
+
+# =====================================================
+# CHILD PROCESS (runs the app headless and reports timings)
+# =====================================================
+
+async def _drive_app(main_module, push_screens):
+    timings = {}
+    app = main_module.TextualApp()
+
+    t0 = time.perf_counter()
+    async with app.run_test(headless=True) as pilot:
+        await pilot.pause()
+        timings["first_paint"] = time.perf_counter() - t0
+
+        if push_screens:
+            for label, module_attr, class_name in SCREENS:
+                screen_cls = getattr(getattr(main_module, module_attr), class_name)
+                t1 = time.perf_counter()
+                await app.push_screen(screen_cls())
+                await pilot.pause()
+                timings[f"screen:{label}"] = time.perf_counter() - t1
+                app.pop_screen()
+                await pilot.pause()
+
+    return timings
+
+
+def run_child(push_screens):
+    t0 = time.perf_counter()
+    sys.path.insert(0, str(SCREENS_DIR))
+    import main as main_module
+    import_time = time.perf_counter() - t0
+
+    timings = asyncio.run(_drive_app(main_module, push_screens))
+    timings["import"] = import_time
+    print(json.dumps(timings))
+
+
+# =====================================================
+# PARENT PROCESS (spawns children and aggregates)
+# =====================================================
+
+def _spawn(env, push_screens=False):
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--child"]
+    if push_screens:
+        cmd.append("--push-screens")
+
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, cwd=ROOT, capture_output=True, text=True)
+    wall = time.perf_counter() - t0
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmark child failed:\n{proc.stderr}")
+
+    # The timings are the last line of stdout
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings["process"] = wall
+    return timings
+
+
+def _child_env(cache_dir):
+    """Environment of a child using `cache_dir` as its bytecode cache."""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+    # Otherwise the priming run writes no cache and every "warm" run is cold
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def measure_startup(runs):
+    """Return lists of per-run timings for cold and warm starts."""
+    cold, warm = [], []
+
+    for _ in range(runs):
+        # Cold: a fresh, empty bytecode cache for every run
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(_spawn(_child_env(cache_dir)))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = _child_env(cache_dir)
+        _spawn(env)  # prime the bytecode cache
+        for _ in range(runs):
+            warm.append(_spawn(env))
+        screens = [_spawn(env, push_screens=True) for _ in range(runs)]
+
+    return cold, warm, screens
+
+
+def import_breakdown(top):
+    """Run `python -X importtime` on the app module and return the heaviest imports."""
+    code = f"import sys; sys.path.insert(0, {str(SCREENS_DIR)!r}); import main"
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    cmd = [sys.executable, "-X", "importtime", "-c", code]
+    subprocess.run(cmd[:1] + ["-c", code], env=env, cwd=ROOT, capture_output=True)  # write bytecode first
+    proc = subprocess.run(cmd, env=env, cwd=ROOT, capture_output=True, text=True)
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    # Per top-level package totals (sum of self time)
+    packages = {}
+    for name, self_us, _ in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    by_cumulative = sorted(rows, key=lambda r: r[2], reverse=True)[:top]
+    by_package = sorted(packages.items(), key=lambda r: r[1], reverse=True)[:top]
+    return by_cumulative, by_package
+
+
+# =====================================================
+# REPORTING
+# =====================================================
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return 0.5 * (values[mid - 1] + values[mid])
+
+
+def parse_budgets(items, budgets_file):
+    budgets = {}
+    if budgets_file:
+        budgets.update(json.loads(Path(budgets_file).read_text()))
+    for item in items or []:
+        key, _, value = item.partition("=")
+        if not value:
+            raise ValueError(f"Budget must look like name=seconds, got '{item}'")
+        budgets[key.strip()] = float(value)
+    return budgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TextualApp startup and screen push times.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="Number of modules shown in the import breakdown")
+    parser.add_argument("--budget", action="append",
+                        help="Budget in seconds: cold=, warm=, screen= (all screens) or screen:<name>=")
+    parser.add_argument("--budgets", help="JSON file with the same budget keys")
+    parser.add_argument("--json", dest="json_out", help="Write the full report to this JSON file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--push-screens", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.push_screens)
+        return 0
+
+    budgets = parse_budgets(args.budget, args.budgets)
+    cold, warm, screens = measure_startup(args.runs)
+
+    results = {
+        "cold": _median([r["process"] for r in cold]),
+        "cold_first_paint": _median([r["first_paint"] for r in cold]),
+        "warm": _median([r["process"] for r in warm]),
+        "warm_first_paint": _median([r["first_paint"] for r in warm]),
+        "warm_import": _median([r["import"] for r in warm]),
+    }
+    for label, _, _ in SCREENS:
+        results[f"screen:{label}"] = _median([r[f"screen:{label}"] for r in screens])
+
+    print("=== Startup (median seconds) ===")
+    for key, value in results.items():
+        print(f"{key:<28} {value:8.3f}")
+
+    by_cumulative, by_package = import_breakdown(args.top)
+    print("\n=== -X importtime: heaviest modules (cumulative ms) ===")
+    for name, _, cumulative_us in by_cumulative:
+        print(f"{name:<48} {cumulative_us / 1000:8.1f}")
+    print("\n=== -X importtime: per package (self ms) ===")
+    for package, self_us in by_package:
+        print(f"{package:<48} {self_us / 1000:8.1f}")
+
+    # Budget checks
+    failures = []
+    for key, limit in budgets.items():
+        if key == "screen":
+            checked = {k: v for k, v in results.items() if k.startswith("screen:")}
+        elif key in results:
+            checked = {key: results[key]}
+        else:
+            failures.append(f"unknown budget '{key}'")
+            continue
+        for name, value in checked.items():
+            if value > limit:
+                failures.append(f"{name}: {value:.3f}s > budget {limit:.3f}s")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps({
+            "results": results,
+            "imports": [{"module": n, "self_us": s, "cumulative_us": c} for n, s, c in by_cumulative],
+            "budgets": budgets,
+            "failures": failures,
+        }, indent=2))
+
+    if failures:
+        print("\n❌ Budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    if budgets:
+        print("\n✅ All budgets met.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
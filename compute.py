@@ -0,0 +1,225 @@
+"""Shared compute pool for the served (multi-user) mode.
+
+In served mode (see serve.py) every browser session runs its own app process, so
+session state is isolated, but heavy symbolic and numeric work from all sessions
+goes to one size-limited process pool owned by the server:
+
+- `ComputePool` runs jobs on a fixed number of worker processes. Each session has
+  its own queue and sessions are served round-robin, so one busy user cannot starve
+  the others; a session with too many pending jobs gets an error instead of
+  growing the queue without bound.
+- `serve()` exposes a pool on a local, authenticated socket; `Client` submits jobs
+  to it under a session id.
+- `call(func, *args)` is what the screens use: it runs `func` in the shared pool
+  when THERMAL_SIM_COMPUTE_ADDRESS is set (serve.py sets it for the sessions) and
+  simply calls it in-process otherwise.
+
+Jobs are module-level functions and picklable arguments, e.g.
+`call(derivatives.integrate, f_expr, 0.0, 3.0)`.
+"""
+import os
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing.connection import Client as _Connect, Listener
+
+config = {
+    "address": os.environ.get("THERMAL_SIM_COMPUTE_ADDRESS") or None,  # "host:port"
+    "authkey": os.environ.get("THERMAL_SIM_COMPUTE_KEY", ""),
+    "session": uuid.uuid4().hex[:12],  # one app process = one session
+}
+
+
+# =====================================================
+# POOL (server side)
+# =====================================================
+
+class ComputePool:
+    """Process pool with fair (round-robin) scheduling across sessions.
+
+    Args:
+        workers: number of worker processes (default: CPU count)
+        queue_limit: maximum pending jobs per session
+    """
+
+    def __init__(self, workers=None, queue_limit=16):
+        if queue_limit < 1:
+            raise ValueError("queue_limit must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit
+        self._executor = ProcessPoolExecutor(self.workers)
+        self._queues = OrderedDict()  # session -> deque of (future, func, args), in turn order
+        self._running = 0
+        self._closed = False
+        self._lock = threading.RLock()
+
+    def submit(self, session, func, *args) -> Future:
+        """Queue func(*args) for `session`; the returned future holds its result."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(RuntimeError("The compute pool is shut down"))
+                return future
+            queue = self._queues.setdefault(session, deque())
+            if len(queue) >= self.queue_limit:
+                future.set_exception(RuntimeError(
+                    f"Too many pending computations for this session (limit {self.queue_limit})"))
+                return future
+            queue.append((future, func, args))
+            self._dispatch()
+        return future
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def _dispatch(self):
+        # Called with the lock held: start the next job of the session whose turn it is
+        while self._running < self.workers and self._queues:
+            session, queue = next(iter(self._queues.items()))
+            future, func, args = queue.popleft()
+            if queue:
+                self._queues.move_to_end(session)
+            else:
+                del self._queues[session]
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                inner = self._submit(func, args)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            self._running += 1
+            inner.add_done_callback(partial(self._finished, future))
+
+    def _submit(self, func, args):
+        # Called with the lock held
+        try:
+            return self._executor.submit(func, *args)
+        except BrokenProcessPool:
+            # A worker process died (OOM kill, crash in a JIT kernel) and the executor
+            # stays unusable: replace it so later jobs from every session still run
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = ProcessPoolExecutor(self.workers)
+            return self._executor.submit(func, *args)
+
+    def _finished(self, future, inner):
+        with self._lock:
+            self._running -= 1
+            self._dispatch()
+        if inner.cancelled():
+            # Cancelled by shutdown(); exception() would raise CancelledError here
+            future.set_exception(CancelledError("The compute pool was shut down"))
+            return
+        error = inner.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(inner.result())
+
+    def shutdown(self):
+        """Stop the workers; queued jobs fail instead of waiting forever."""
+        with self._lock:
+            self._closed = True
+            queued = [job for queue in self._queues.values() for job in queue]
+            self._queues.clear()
+        for future, _, _ in queued:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("The compute pool is shut down"))
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def serve(pool: ComputePool, address=("127.0.0.1", 0), authkey: bytes = b"") -> Listener:
+    """Accept client connections for `pool` in a background thread; returns the listener."""
+    listener = Listener(address, authkey=authkey or None)
+
+    def accept():
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError:
+                return  # listener closed
+            except Exception:
+                continue  # failed handshake (wrong key)
+            threading.Thread(target=_handle, args=(pool, conn), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    return listener
+
+
+def _handle(pool, conn):
+    with conn:
+        try:
+            session = conn.recv()
+        except EOFError:
+            return
+        while True:
+            try:
+                func, args = conn.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                reply = ("ok", pool.submit(session, func, *args).result())
+            except Exception as e:
+                reply = ("error", e)
+            try:
+                conn.send(reply)
+            except (EOFError, OSError):
+                return
+            except Exception as e:
+                # Result or exception could not be pickled
+                conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+# =====================================================
+# CLIENT (session side)
+# =====================================================
+
+class Client:
+    """Connection to a served pool for one session (one job at a time per client)."""
+
+    def __init__(self, address: str, authkey: str = "", session=None):
+        host, port = address.rsplit(":", 1)
+        self.session = session or uuid.uuid4().hex[:12]
+        self._conn = _Connect((host, int(port)), authkey=authkey.encode() or None)
+        self._conn.send(self.session)
+
+    def call(self, func, *args):
+        self._conn.send((func, args))
+        status, value = self._conn.recv()
+        if status == "error":
+            raise value
+        return value
+
+    def close(self):
+        self._conn.close()
+
+
+_idle = []  # open connections of this session not currently in use
+_idle_lock = threading.Lock()
+
+
+def call(func, *args):
+    """Run func(*args) in the shared pool when served, otherwise in-process."""
+    if not config["address"]:
+        return func(*args)
+
+    # Worker threads come and go, so connections are pooled rather than per thread
+    with _idle_lock:
+        client = _idle.pop() if _idle else None
+    if client is None:
+        client = Client(config["address"], config["authkey"], config["session"])
+
+    try:
+        return client.call(func, *args)
+    except (EOFError, OSError):
+        client.close()  # connection lost: do not reuse it
+        client = None
+        raise
+    finally:
+        if client is not None:
+            with _idle_lock:
+                _idle.append(client)
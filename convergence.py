@@ -0,0 +1,220 @@
+"""Convergence studies: error vs. step size sweeps with the observed order of accuracy.
+
+A study runs one numerical method over a geometric sequence of step sizes, compares
+each estimate with the exact reference, fits the observed order p from
+log|error| = p log h + c and detects where round-off error takes over.
+f is evaluated once, vectorized, over all sample points the sweep needs.
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+import sympy as sp
+
+import derivatives
+import integration as integ
+import memo
+import plotting
+import utils
+
+DEFAULT_COUNT = 12  # step sizes per study
+MAX_COUNT = 50
+MAX_SAMPLES = 10_000_000  # samples of the finest grid of an integration study
+
+
+def _check_count(count: int) -> None:
+    if not 2 <= count <= MAX_COUNT:
+        raise ValueError(f"The number of step sizes must be between 2 and {MAX_COUNT}")
+
+
+def step_sizes(h0: float, ratio: float = 2.0, count: int = DEFAULT_COUNT) -> np.ndarray:
+    """Geometric sequence h0, h0/ratio, h0/ratio**2, ... of `count` step sizes."""
+    if h0 <= 0:
+        raise ValueError("h0 must be positive")
+    if ratio <= 1:
+        raise ValueError("ratio must be greater than 1")
+    _check_count(count)
+    with np.errstate(over="ignore"):
+        steps = h0 / ratio ** np.arange(count)
+    if steps[-1] <= 0:
+        raise ValueError("The smallest step size underflows to 0; use a smaller ratio or fewer step sizes")
+    return steps
+
+
+# =====================================================
+# DIFFERENTIATION
+# =====================================================
+
+def differentiation_study(f, x: float, exact: float, method, steps) -> dict:
+    """Sweep a difference formula `method(f, x, h)` over `steps`.
+
+    The points each formula needs are collected first, f is evaluated once on all of
+    them (f(x) is shared by every step), then the formula is applied to the samples.
+    """
+    steps = np.asarray(steps, dtype=float)
+
+    # Probe which points the method evaluates, without evaluating f
+    points = []
+    def record(t):
+        points.append(t)
+        return 0.0
+    for h in steps:
+        method(record, x, float(h))
+
+    unique = np.unique(np.asarray(points, dtype=float))
+    values = np.broadcast_to(np.asarray(f(unique), dtype=float), unique.shape)
+    samples = dict(zip(unique.tolist(), values.tolist()))
+    lookup = lambda t: samples[t]
+
+    approx = np.array([method(lookup, x, float(h)) for h in steps])
+    study = _analyze(steps, approx, exact)
+    study["evaluations"] = len(unique)
+    study["method"] = method.__name__
+    return study
+
+
+# =====================================================
+# INTEGRATION
+# =====================================================
+
+def integration_study(f, a: float, b: float, exact: float, rule, h0: float, count: int = DEFAULT_COUNT) -> dict:
+    """Sweep a composite rule `rule(f, a, b, N)` with N doubling (h halving) from h0.
+
+    The grids are nested, so f is only evaluated on the finest grid and every coarser
+    grid reuses a strided view of those samples. The finest grid may have at most
+    MAX_SAMPLES points.
+    """
+    _check_count(count)
+    N0 = integ.n_from_step(a, b, h0)
+    finest = N0 * 2 ** (count - 1)  # Python int: no overflow before the check
+    if finest + 1 > MAX_SAMPLES:
+        raise ValueError(f"The finest grid would need {finest + 1:,} samples (limit {MAX_SAMPLES:,}); "
+                         f"use a larger h0 or fewer step sizes")
+    Ns = N0 * 2 ** np.arange(count)
+
+    y_fine = np.broadcast_to(np.asarray(f(np.linspace(a, b, finest + 1)), dtype=float), (finest + 1,))
+
+    def nested(xs):
+        stride, remainder = divmod(finest, len(xs) - 1)
+        if remainder:
+            return f(xs)
+        return y_fine[::stride]
+
+    approx = np.array([rule(nested, a, b, int(N)) for N in Ns])
+    steps = (b - a) / Ns
+
+    study = _analyze(steps, approx, exact)
+    study["n"] = Ns
+    study["evaluations"] = finest + 1
+    study["method"] = rule.__name__
+    return study
+
+
+def run_study(kind: str, method, f, h0: float, count: int = DEFAULT_COUNT,
+              x0=None, ratio: float = 2.0, a=None, b=None):
+    """Study of a model given as text or SymPy expression, exact reference included.
+
+    kind is "diff" (at x0, step ratio `ratio`) or "integ" (on [a, b]). Module-level
+    and picklable, so the screens can run it with compute.call(). Returns
+    (exact, study).
+    """
+    expr = derivatives.parse(f)
+    f_np = memo.shared(expr)
+    if kind == "diff":
+        exact = float(sp.diff(expr, derivatives.X_SYMBOL).subs(derivatives.X_SYMBOL, x0))
+        return exact, differentiation_study(f_np, x0, exact, method, step_sizes(h0, ratio, count))
+    exact = derivatives.integrate(expr, a, b)
+    return exact, integration_study(f_np, a, b, exact, method, h0, count)
+
+
+# =====================================================
+# ANALYSIS
+# =====================================================
+
+def _analyze(steps, approx, exact) -> dict:
+    abs_err = utils.absolute_error(approx, exact)
+    rel_err = utils.relative_error(approx, exact) if exact != 0 else np.full_like(abs_err, np.nan)
+
+    # Order between consecutive steps: log(e_i / e_{i+1}) / log(h_i / h_{i+1})
+    with np.errstate(divide="ignore", invalid="ignore"):
+        local_order = np.log(abs_err[:-1] / abs_err[1:]) / np.log(steps[:-1] / steps[1:])
+
+    # Past the smallest error, shrinking h only makes things worse: round-off dominates
+    best = int(np.argmin(abs_err))
+    roundoff_index = best + 1 if best < len(abs_err) - 1 and np.any(abs_err[best + 1:] > abs_err[best]) else None
+
+    # The smallest error is usually already polluted by round-off (lucky cancellation), so
+    # when round-off was detected the fit stops one step earlier
+    fit_slice = slice(0, best if roundoff_index is not None and best >= 2 else best + 1)
+    usable = abs_err[fit_slice] > 0
+    if np.count_nonzero(usable) >= 2:
+        order, intercept = np.polyfit(np.log(steps[fit_slice][usable]), np.log(abs_err[fit_slice][usable]), 1)
+    else:
+        # Exact to machine precision (e.g. Simpson on a cubic): no order can be observed
+        order, intercept = np.nan, np.nan
+
+    return {
+        "h": steps,
+        "approx": approx,
+        "exact": exact,
+        "abs_error": abs_err,
+        "rel_error": rel_err,
+        "local_order": local_order,
+        "order": float(order),
+        "intercept": float(intercept),
+        "roundoff_index": roundoff_index,
+    }
+
+
+def format_table(study: dict) -> str:
+    """Plain-text table of a study, one row per step size."""
+    has_n = "n" in study
+    header = f"{'h':>11}" + (f"{'N':>9}" if has_n else "") + f"{'Approx':>18}{'|Error|':>12}{'Rel Error':>12}{'Order':>8}"
+    lines = [header]
+
+    for i, h in enumerate(study["h"]):
+        order = f"{study['local_order'][i - 1]:8.3f}" if i > 0 else f"{'':>8}"
+        row = f"{h:11.3e}"
+        if has_n:
+            row += f"{int(study['n'][i]):9d}"
+        row += f"{study['approx'][i]:18.10f}{study['abs_error'][i]:12.3e}{study['rel_error'][i]:12.3e}{order}"
+        if study["roundoff_index"] is not None and i >= study["roundoff_index"]:
+            row += "  ← round-off"
+        lines.append(row)
+
+    if np.isnan(study["order"]):
+        lines.append("Observed order: n/a (errors at machine precision)")
+    else:
+        lines.append(f"Observed order of accuracy (log-log fit): {study['order']:.3f}")
+    if study["roundoff_index"] is not None:
+        lines.append(f"Round-off dominates below h ≈ {study['h'][study['roundoff_index'] - 1]:.3e}")
+    lines.append(f"Function evaluations: {study['evaluations']}")
+    return "\n".join(lines)
+
+
+@plotting.renders
+def plot(study: dict, title: str = "Convergence study"):
+    """Log-log plot of |error| vs. h with the fitted order.
+
+    Returns:
+        path of the saved plot file, or None when it opened in a window
+    """
+    h = study["h"]
+    err = study["abs_error"]
+    positive = err > 0
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.loglog(h[positive], err[positive], "o-", label="|error|")
+
+    if not np.isnan(study["order"]):
+        fit = np.exp(study["intercept"]) * h ** study["order"]
+        ax.loglog(h, fit, "--", label=f"fit: order {study['order']:.2f}")
+
+    if study["roundoff_index"] is not None:
+        h_min = h[study["roundoff_index"] - 1]
+        ax.axvline(h_min, color="r", linestyle=":", label=f"round-off onset (h ≈ {h_min:.1e})")
+
+    ax.invert_xaxis()
+    ax.set_xlabel("Step size h")
+    ax.set_ylabel("Absolute error")
+    ax.set_title(f"{title} ({study['method']})")
+    ax.legend()
+    return plotting.show(fig, name="convergence")
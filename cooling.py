@@ -0,0 +1,199 @@
+"""Streaming estimation of Newton's Law of Cooling parameters from measurements.
+
+Newton's Law of Cooling, dT/dt = -k (T - Tₐ), is a straight line in the (T, dT/dt)
+plane with slope -k and root Tₐ. `CoolingEstimator` fits that line by least squares
+while samples arrive: dT/dt is taken from the central difference at the midpoint of
+each sample interval, and only the running weighted means and co-moments of T and
+dT/dt are kept (Welford updates, merged chunk-wise for arrays). Memory use is
+constant and every sample costs O(1) work, so the estimator can follow a live
+stream or a log file of any size:
+
+    est = CoolingEstimator()
+    for t, T in stream:
+        est.update(t, T)
+        print(est.k, est.ambient)
+
+    est = estimate_file("log.npy")   # memory-mapped, read in chunks
+"""
+import numpy as np
+
+import dataio
+
+
+class CoolingEstimator:
+    """Online least-squares fit of dT/dt = -k (T - Tₐ).
+
+    Args:
+        forgetting: weight factor applied to older samples at every new sample;
+            1.0 (default) weighs all samples equally, values slightly below 1
+            (e.g. 0.99) track slowly changing conditions
+    """
+
+    def __init__(self, forgetting: float = 1.0):
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError("forgetting must be in (0, 1]")
+        self.forgetting = forgetting
+        self.samples = 0
+        self._last = None  # previous (t, T) sample
+
+        # Weighted statistics of x = T (interval midpoint) and y = dT/dt
+        self._weight = 0.0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._syy = 0.0
+
+    # =====================================================
+    # UPDATES
+    # =====================================================
+
+    def update(self, t: float, T: float) -> None:
+        """Add one (time, temperature) sample."""
+        t = float(t)
+        T = float(T)
+        last = self._last
+        if last is not None and t - last[0] <= 0:
+            # Reject before touching any state, so the next sample pairs with `last`
+            raise ValueError("Time values must be strictly increasing.")
+        self._last = (t, T)
+        self.samples += 1
+        if last is None:
+            return
+
+        dt = t - last[0]
+        x = 0.5 * (T + last[1])
+        y = (T - last[1]) / dt
+
+        lam = self.forgetting
+        self._weight = lam * self._weight + 1.0
+        self._sxx *= lam
+        self._sxy *= lam
+        self._syy *= lam
+
+        dx = x - self._mean_x
+        dy = y - self._mean_y
+        self._mean_x += dx / self._weight
+        self._mean_y += dy / self._weight
+        self._sxx += dx * (x - self._mean_x)
+        self._sxy += dx * (y - self._mean_y)
+        self._syy += dy * (y - self._mean_y)
+
+    def update_many(self, t, T) -> None:
+        """Add a chunk of samples (vectorized; same result as calling `update` per sample)."""
+        t = np.asarray(t, dtype=float).ravel()
+        T = np.asarray(T, dtype=float).ravel()
+        if len(t) != len(T):
+            raise ValueError("Time and Temperature must have the same number of values.")
+        if len(t) == 0:
+            return
+
+        if self._last is not None:
+            t_all = np.concatenate(([self._last[0]], t))
+            T_all = np.concatenate(([self._last[1]], T))
+        else:
+            t_all, T_all = t, T
+
+        dt = np.diff(t_all)
+        if np.any(dt <= 0):
+            raise ValueError("Time values must be strictly increasing.")
+        self._last = (float(t[-1]), float(T[-1]))
+        self.samples += len(t)
+
+        m = len(dt)
+        if m == 0:
+            return
+        x = 0.5 * (T_all[1:] + T_all[:-1])
+        y = np.diff(T_all) / dt
+
+        # Newest sample has weight 1, each older one is discounted once more
+        lam = self.forgetting
+        w = lam ** np.arange(m - 1, -1, -1, dtype=float) if lam < 1.0 else np.ones(m)
+        decay = lam ** m
+
+        # Statistics of the chunk, then merged with the running ones (Chan et al.)
+        w_b = w.sum()
+        mean_xb = np.dot(w, x) / w_b
+        mean_yb = np.dot(w, y) / w_b
+        cx = x - mean_xb
+        cy = y - mean_yb
+        sxx_b = np.dot(w * cx, cx)
+        sxy_b = np.dot(w * cx, cy)
+        syy_b = np.dot(w * cy, cy)
+
+        w_a = self._weight * decay
+        total = w_a + w_b
+        dx = mean_xb - self._mean_x
+        dy = mean_yb - self._mean_y
+        factor = w_a * w_b / total
+
+        self._mean_x += dx * w_b / total
+        self._mean_y += dy * w_b / total
+        self._sxx = self._sxx * decay + sxx_b + dx * dx * factor
+        self._sxy = self._sxy * decay + sxy_b + dx * dy * factor
+        self._syy = self._syy * decay + syy_b + dy * dy * factor
+        self._weight = total
+
+    # =====================================================
+    # ESTIMATES
+    # =====================================================
+
+    @property
+    def slope(self) -> float:
+        """Fitted slope of dT/dt vs. T (equals -k); NaN until T has varied."""
+        if self._sxx <= 0:
+            return float("nan")
+        return self._sxy / self._sxx
+
+    @property
+    def k(self) -> float:
+        """Cooling constant k (1/s); negative values mean the data moves away from Tₐ."""
+        return -self.slope
+
+    @property
+    def ambient(self) -> float:
+        """Ambient temperature Tₐ, where the fitted dT/dt crosses zero."""
+        slope = self.slope
+        if not slope:
+            return float("nan")
+        return self._mean_x - self._mean_y / slope
+
+    @property
+    def r_squared(self) -> float:
+        """Coefficient of determination of the linear fit."""
+        if self._sxx <= 0 or self._syy <= 0:
+            return float("nan")
+        return self._sxy ** 2 / (self._sxx * self._syy)
+
+    def predict(self, t: float) -> float:
+        """Temperature at time t from the fitted model, starting at the last sample."""
+        if self._last is None:
+            raise ValueError("No samples yet.")
+        t0, T0 = self._last
+        return self.ambient + (T0 - self.ambient) * np.exp(-self.k * (t - t0))
+
+    def summary(self) -> str:
+        """Short text block for the screens' output panels."""
+        if np.isnan(self.k):
+            return f"Samples: {self.samples}\nNot enough varying data to estimate k yet."
+        return (
+            f"Samples: {self.samples}\n"
+            f"Cooling constant k: {self.k:.6g} 1/s\n"
+            f"Ambient temperature Tₐ: {self.ambient:.6g} °C\n"
+            f"Fit R²: {self.r_squared:.6f}"
+        )
+
+
+def estimate(t, T, forgetting: float = 1.0) -> CoolingEstimator:
+    """Fit k and Tₐ to arrays of time and temperature values."""
+    est = CoolingEstimator(forgetting)
+    est.update_many(t, T)
+    return est
+
+
+def estimate_file(path, forgetting: float = 1.0, chunk_rows: int = dataio.CHUNK_ROWS) -> CoolingEstimator:
+    """Fit k and Tₐ to a data file (see dataio), one chunk in memory at a time."""
+    est = CoolingEstimator(forgetting)
+    for t, T in dataio.iter_columns(path, chunk_rows=chunk_rows):
+        est.update_many(t, T)
+    return est
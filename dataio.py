@@ -0,0 +1,138 @@
+"""Fast input parsing and file-based loading of time / temperature data.
+
+- `parse_values` turns pasted comma- or whitespace-separated numbers into an array
+  with one vectorized NumPy conversion instead of a float() call per token.
+- `load_columns` reads the time and temperature columns from CSV/TXT (in chunks),
+  NPY (memory-mapped) or NPZ files; `iter_columns` yields them chunk by chunk for
+  files too large to hold in memory.
+- `summarize` describes large arrays briefly instead of echoing every value.
+"""
+import itertools
+from pathlib import Path
+
+import numpy as np
+
+CHUNK_ROWS = 100_000
+SUMMARY_LIMIT = 20
+
+
+def parse_values(text: str) -> np.ndarray:
+    """Parse comma- (or whitespace-) separated numbers into a float array."""
+    text = text.strip().strip(",").strip()
+    if not text:
+        raise ValueError("Input cannot be empty.")
+
+    try:
+        # NumPy converts all tokens at once (surrounding whitespace is allowed)
+        return np.array(text.split(",") if "," in text else text.split(), dtype=float)
+    except ValueError:
+        pass
+
+    # Slow path: empty tokens are skipped, invalid ones reported by name
+    tokens = text.replace(",", " ").split()
+    bad = next((v for v in tokens if not _is_float(v)), None)
+    if bad is not None:
+        raise ValueError(f"'{bad}' is not a valid number.")
+    return np.array(tokens, dtype=float)
+
+
+def _is_float(token: str) -> bool:
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def load_columns(path, columns=(0, 1), chunk_rows: int = CHUNK_ROWS):
+    """Load time and temperature columns from a data file.
+
+    Supported files:
+    - .csv / .txt: comma- or whitespace-delimited, optional header line, read in chunks
+    - .npy: a (n, 2+) or (2+, n) array, memory-mapped
+    - .npz: arrays named t/time and T/temperature, or the first two arrays
+
+    Returns:
+        (t, T) float arrays
+    """
+    t_chunks, T_chunks = [], []
+    for t, T in iter_columns(path, columns, chunk_rows):
+        t_chunks.append(t)
+        T_chunks.append(T)
+
+    if not t_chunks:
+        raise ValueError(f"No data rows found in {path}")
+    if len(t_chunks) == 1:
+        return t_chunks[0], T_chunks[0]
+    return np.concatenate(t_chunks), np.concatenate(T_chunks)
+
+
+def iter_columns(path, columns=(0, 1), chunk_rows: int = CHUNK_ROWS):
+    """Yield (t, T) chunks of at most `chunk_rows` rows from a data file.
+
+    Only one chunk is in memory at a time for CSV/TXT and NPY files (NPY files are
+    memory-mapped); NPZ archives are yielded as a single chunk.
+    """
+    path = Path(path).expanduser()
+    if not path.is_file():
+        raise FileNotFoundError(f"Data file not found: {path}")
+
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 2 or min(data.shape) < 2:
+            raise ValueError(f"NPY data must be an (n, 2) array of time and temperature columns "
+                             f"or a (2, n) array of rows, got shape {data.shape}.")
+        if data.shape[0] == 2 and data.shape[1] > 2:
+            data = data.T  # stored as rows (time row, temperature row)
+        if max(columns) >= data.shape[1]:
+            raise ValueError(f"NPY data has {data.shape[1]} columns, column {max(columns)} was requested.")
+        for start in range(0, data.shape[0], chunk_rows):
+            rows = data[start:start + chunk_rows]
+            yield (np.asarray(rows[:, columns[0]], dtype=float),
+                   np.asarray(rows[:, columns[1]], dtype=float))
+
+    elif suffix == ".npz":
+        with np.load(path) as archive:
+            names = list(archive.keys())
+            t_name = next((n for n in ("t", "time") if n in archive), names[0])
+            T_name = next((n for n in ("T", "temperature", "temp") if n in archive), None)
+            if T_name is None:
+                T_name = next((n for n in names if n != t_name), None)
+            if T_name is None:
+                raise ValueError("NPZ data needs a time and a temperature array (e.g. named t and T).")
+            yield np.asarray(archive[t_name], dtype=float), np.asarray(archive[T_name], dtype=float)
+
+    else:
+        yield from _iter_text(path, columns, chunk_rows)
+
+
+def _iter_text(path, columns, chunk_rows):
+    with open(path, encoding="utf-8") as fh:
+        first = fh.readline()
+        delimiter = "," if "," in first else None
+
+        # Keep the first line unless it is a header
+        try:
+            np.array(first.replace(",", " ").split(), dtype=float)
+            lines = itertools.chain([first], fh)
+        except ValueError:
+            lines = fh
+
+        while True:
+            chunk = list(itertools.islice(lines, chunk_rows))
+            if not chunk:
+                break
+            data = np.loadtxt(chunk, delimiter=delimiter, usecols=columns, ndmin=2)
+            yield data[:, 0], data[:, 1]
+
+
+def summarize(values, limit: int = SUMMARY_LIMIT) -> str:
+    """Short description of an array: all values when small, a summary when large."""
+    values = np.asarray(values, dtype=float)
+    if len(values) <= limit:
+        return str(values.tolist())
+    head = ", ".join(f"{v:g}" for v in values[:3])
+    tail = ", ".join(f"{v:g}" for v in values[-3:])
+    return (f"{len(values):,} values [{head}, …, {tail}] "
+            f"(min {values.min():g}, max {values.max():g}, mean {values.mean():g})")
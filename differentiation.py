@@ -1,7 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+import instrumentation
+import plotting
 
+
+@instrumentation.timed
 def forward_difference(f, x, h):
     """
     Calculates the derivative of function f at point x using the
@@ -10,6 +14,7 @@ def forward_difference(f, x, h):
     return (f(x + h) - f(x)) / h
 
 
+@instrumentation.timed
 def backward_difference(f, x, h):
     """
     Calculates the derivative of function f at point x using the
@@ -18,6 +23,7 @@ def backward_difference(f, x, h):
     return (f(x) - f(x - h)) / h
 
 
+@instrumentation.timed
 def central_difference(f, x, h):
     """
     Calculates the derivative of function f at point x using the
@@ -26,26 +32,37 @@ def central_difference(f, x, h):
     return (f(x + h) - f(x - h)) / (2 * h)
 
 
-def plot(f, x, h, method):
+@plotting.renders
+def plot(f, x, h, method, exact=None):
     """Plot the function and numerical derivative approximation.
 
     Args:
-        f: callable, function f(x)
+        f: callable, vectorized function f(x)
         x: float, center point to view around
         h: float, step size used by numerical method
         method: callable(f, x_point, h) -> derivative estimate
+        exact: optional vectorized exact derivative f'(x) (see derivatives.py),
+            plotted as the reference instead of np.gradient
+
+    Returns:
+        path of the saved plot file, or None when it opened in a window
     """
     # Choose a window for plotting around the chosen x
     span = max(1.0, 10.0 * abs(h))
     xs = np.linspace(x - span / 2.0, x + span / 2.0, 400)
 
-    # function values and derivative approximations
-    fxs = np.array([f(xi) for xi in xs])
-    approx_deriv = np.array([method(f, xi, h) for xi in xs])
+    # function values and derivative approximations, one vectorized call each
+    fxs = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+    approx_deriv = np.broadcast_to(np.asarray(method(f, xs, h), dtype=float), xs.shape)
 
-    # Numerical derivative (reference) computed from the sampled f values
-    # using central differences on the dense grid
-    num_deriv = np.gradient(fxs, xs)
+    if exact is not None:
+        ref_deriv = np.broadcast_to(np.asarray(exact(xs), dtype=float), xs.shape)
+        ref_label = "Exact d/dx"
+    else:
+        # Numerical derivative (reference) computed from the sampled f values
+        # using central differences on the dense grid
+        ref_deriv = np.gradient(fxs, xs)
+        ref_label = "Numerical d/dx (gradient)"
 
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), sharex=True)
 
@@ -54,7 +71,7 @@ def plot(f, x, h, method):
     ax1.set_ylabel("Temperature")
     ax1.legend()
 
-    ax2.plot(xs, num_deriv, label="Numerical d/dx (gradient)")
+    ax2.plot(xs, ref_deriv, label=ref_label)
     ax2.plot(xs, approx_deriv, '--', label=f"Approx ({method.__name__})")
     ax2.scatter([x], [method(f, x, h)], color="k", zorder=5, label="Approx at x")
     ax2.set_xlabel("Time")
@@ -62,5 +79,5 @@ def plot(f, x, h, method):
     ax2.legend()
 
     fig.suptitle(f"Derivative approximation using {method.__name__}")
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    fig.tight_layout()
+    return plotting.show(fig, name="differentiation")
@@ -0,0 +1,131 @@
+"""Visual downsampling for plotting large datasets.
+
+Plots only need as many points as the screen can show. These helpers reduce a
+series to at most `max_points` while keeping its visual shape and its peaks:
+
+- "minmax": per bucket, keep the samples holding the minimum and the maximum (fully vectorized).
+- "lttb": Largest-Triangle-Three-Buckets, keeps the point of each bucket that forms the
+  largest triangle with its neighbours (vectorized within each bucket).
+
+The point count above which plot helpers downsample and the default method can be set with
+THERMAL_SIM_MAX_PLOT_POINTS and THERMAL_SIM_DOWNSAMPLE, or through `config`.
+"""
+import os
+
+import numpy as np
+
+METHODS = ("minmax", "lttb")
+
+config = {
+    "max_points": int(os.environ.get("THERMAL_SIM_MAX_PLOT_POINTS", "5000")),
+    "method": os.environ.get("THERMAL_SIM_DOWNSAMPLE", "minmax"),
+}
+
+
+def downsample(x, y, max_points=None, method=None):
+    """Reduce (x, y) to at most `max_points` points for plotting.
+
+    Series with at most `max_points` points are returned unchanged (as float arrays).
+    x must be sorted in increasing order.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    max_points = config["max_points"] if max_points is None else int(max_points)
+    method = config["method"] if method is None else method
+
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    if len(x) <= max_points:
+        return x, y
+
+    if method == "minmax":
+        idx = minmax_indices(y, max(1, (max_points - 2) // 2))
+    elif method == "lttb":
+        idx = lttb_indices(x, y, max(3, max_points))
+    else:
+        raise ValueError(f"Unknown downsampling method '{method}' (expected one of {METHODS})")
+
+    return x[idx], y[idx]
+
+
+def minmax_indices(y, n_buckets):
+    """Indices of the minimum and maximum of y in each of `n_buckets` equal-count buckets."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    n_buckets = min(n_buckets, n)
+
+    starts = np.linspace(0, n, n_buckets + 1).astype(np.intp)[:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, n)))
+
+    lo = np.minimum.reduceat(y, starts)
+    hi = np.maximum.reduceat(y, starts)
+
+    idx_lo = _first_per_bucket(np.flatnonzero(y == lo[bucket]), bucket)
+    idx_hi = _first_per_bucket(np.flatnonzero(y == hi[bucket]), bucket)
+
+    # Keep the original order so lines are drawn left to right
+    return np.unique(np.concatenate((idx_lo, idx_hi, [0, n - 1])))
+
+
+def _first_per_bucket(idx, bucket):
+    ids = bucket[idx]
+    return idx[np.r_[True, ids[1:] != ids[:-1]]]
+
+
+def lttb_indices(x, y, n_out):
+    """Indices selected by Largest-Triangle-Three-Buckets (first and last point always kept)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries for the inner points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    # Average point of every bucket (the "third" vertex for the previous bucket)
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        bx = x[start:stop]
+        by = y[start:stop]
+        # Twice the triangle area between the previous choice, the candidate and the next average
+        area = np.abs((x[a] - avg_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def bucket_envelope(x, y, n_buckets):
+    """Min/max of y within `n_buckets` equal-width x bins (x must be sorted).
+
+    Returns the left edge of every non-empty bin and the bin minima and maxima.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    width = (x[-1] - x[0]) / n_buckets
+    idx = np.minimum(((x - x[0]) / width).astype(np.intp), n_buckets - 1)
+    starts = np.flatnonzero(np.r_[True, idx[1:] != idx[:-1]])
+
+    edges = x[0] + idx[starts] * width
+    lo = np.minimum.reduceat(y, starts)
+    hi = np.maximum.reduceat(y, starts)
+    return edges, lo, hi
+
+
+def label(text, n_original, n_shown):
+    """Legend label that reports the original point count when data was downsampled."""
+    if n_shown < n_original:
+        return f"{text} ({n_shown:,} of {n_original:,} points shown)"
+    return f"{text} ({n_original:,} points)"
@@ -0,0 +1,153 @@
+"""Evaluation counting and timing for the numerical methods.
+
+Nothing is measured unless a collector is active, so the wrappers only cost one
+flag check on the normal path:
+
+    with instrumentation.collect("central difference") as metrics:
+        f_counted = instrumentation.count_evaluations(f)
+        diff.central_difference(f_counted, 1.0, 0.01)
+    print(metrics.summary())
+
+Collectors are per thread. When a metrics file is given (argument, `config` or the
+THERMAL_SIM_METRICS_FILE environment variable) each finished collector appends one
+JSON line to it for offline analysis.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+
+config = {
+    "metrics_file": os.environ.get("THERMAL_SIM_METRICS_FILE") or None,
+}
+
+_local = threading.local()
+_active = 0  # number of active collectors in all threads (fast disabled check)
+_active_lock = threading.Lock()
+_file_lock = threading.Lock()
+
+
+class Metrics:
+    """Counters gathered while a collector is active."""
+
+    def __init__(self, label=None):
+        self.label = label
+        self.evaluations = 0
+        self.points = 0
+        self.cache_hits = 0
+        self.calls = {}
+        self.seconds = 0.0
+
+    def add_call(self, name: str, seconds: float) -> None:
+        count, total = self.calls.get(name, (0, 0.0))
+        self.calls[name] = (count + 1, total + seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "evaluations": self.evaluations,
+            "points": self.points,
+            "cache_hits": self.cache_hits,
+            "seconds": self.seconds,
+            "calls": {name: {"count": c, "seconds": s} for name, (c, s) in self.calls.items()},
+        }
+
+    def summary(self) -> str:
+        """One short block of text for the screens' output panels."""
+        lines = []
+        if self.evaluations:
+            lines.append(f"Function evaluations: {self.evaluations} call(s), {self.points} point(s)")
+        if self.cache_hits:
+            lines.append(f"Cached evaluations reused: {self.cache_hits}")
+        for name, (count, seconds) in self.calls.items():
+            lines.append(f"{name}: {count} call(s), {seconds * 1e3:.3f} ms")
+        lines.append(f"Total time: {self.seconds * 1e3:.3f} ms")
+        return "\n".join(lines)
+
+
+def _collectors():
+    return getattr(_local, "collectors", ())
+
+
+@contextmanager
+def collect(label=None, metrics_file=None):
+    """Count evaluations and time method calls made by this thread inside the block."""
+    global _active
+
+    metrics = Metrics(label)
+    stack = _local.__dict__.setdefault("collectors", [])
+    stack.append(metrics)
+    with _active_lock:
+        _active += 1
+
+    t0 = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.seconds = time.perf_counter() - t0
+        stack.remove(metrics)
+        with _active_lock:
+            _active -= 1
+
+        path = metrics_file or config["metrics_file"]
+        if path:
+            record = dict(metrics.as_dict(), timestamp=time.time())
+            with _file_lock, open(path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record) + "\n")
+
+
+def timed(func):
+    """Decorator: record call count and wall time of `func` in active collectors."""
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return func(*args, **kwargs)
+        collectors = _collectors()
+        if not collectors:
+            return func(*args, **kwargs)
+
+        t0 = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - t0
+            for metrics in collectors:
+                metrics.add_call(name, elapsed)
+
+    return wrapper
+
+
+class CountingFunction:
+    """Callable wrapper that counts calls and evaluated points of f in active collectors."""
+
+    def __init__(self, f):
+        self.f = f
+        self.__name__ = getattr(f, "__name__", "f")
+
+    def __call__(self, x):
+        if _active:
+            points = np.size(x)
+            for metrics in _collectors():
+                metrics.evaluations += 1
+                metrics.points += points
+        return self.f(x)
+
+
+def count_cache_hit() -> None:
+    """Record an evaluation answered from a cache (see memo.py) in active collectors."""
+    if _active:
+        for metrics in _collectors():
+            metrics.cache_hits += 1
+
+
+def count_evaluations(f) -> CountingFunction:
+    """Wrap a model function so its evaluations are counted (no-op if already wrapped)."""
+    if isinstance(f, CountingFunction):
+        return f
+    return CountingFunction(f)
@@ -1,11 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+import downsampling
+import instrumentation
+import plotting
+
 
 # =====================================================
 # TABULATED DATA METHODS (x, y arrays)
 # =====================================================
 
+@instrumentation.timed
 def trapezoidal_from_points(x, y):
     """Composite trapezoidal rule for tabulated data (non-uniform spacing allowed)."""
     x = np.asarray(x, dtype=float)
@@ -24,6 +29,7 @@ def trapezoidal_from_points(x, y):
     return float(np.sum(dx * (y[:-1] + y[1:]) * 0.5))
 
 
+@instrumentation.timed
 def simpsons_from_points(x, y, tol=1e-9):
     """Composite Simpson's 1/3 rule for tabulated data (uniform spacing required)."""
     x = np.asarray(x, dtype=float)
@@ -54,6 +60,7 @@ def simpsons_from_points(x, y, tol=1e-9):
 # FUNCTION-BASED METHODS (f(x), [a,b], N)
 # =====================================================
 
+@instrumentation.timed
 def trapezoidal_rule(f, a: float, b: float, N: int) -> float:
     """Composite trapezoidal rule for a function f on [a,b] using N subintervals."""
     if N <= 0:
@@ -66,6 +73,7 @@ def trapezoidal_rule(f, a: float, b: float, N: int) -> float:
     return float((h / 2.0) * (y[0] + 2.0 * np.sum(y[1:-1]) + y[-1]))
 
 
+@instrumentation.timed
 def simpsons_rule(f, a: float, b: float, N: int) -> float:
     """Composite Simpson's 1/3 rule for a function f on [a,b] (N must be even)."""
     if N <= 0:
@@ -105,6 +113,7 @@ def n_from_step(a: float, b: float, h: float) -> int:
     return N
 
 
+@plotting.renders
 def plot_from_points(x, y, method_name="trapezoidal"):
     """Plot tabulated data and the numerical integration approximation.
 
@@ -112,6 +121,9 @@ def plot_from_points(x, y, method_name="trapezoidal"):
         x: sequence of x points
         y: sequence of y points
         method_name: 'trapezoidal' or 'simpson' (controls shading/labels)
+
+    Returns:
+        path of the saved plot file, or None when it opened in a window
     """
     x = np.asarray(x, dtype=float)
     y = np.asarray(y, dtype=float)
@@ -119,25 +131,22 @@ def plot_from_points(x, y, method_name="trapezoidal"):
     xs = np.linspace(x.min(), x.max(), 400)
     ys = np.interp(xs, x, y)
 
-    plt.figure(figsize=(8, 4))
-    plt.plot(xs, ys, label="Interpolated function")
-    plt.scatter(x, y, color="k", label="Data points")
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.plot(xs, ys, label="Interpolated function")
+    xd, yd = downsampling.downsample(x, y)
+    ax.scatter(xd, yd, color="k", label=downsampling.label("Data points", len(x), len(xd)))
 
-    # Shade trapezoids for each subinterval (works for either method visually)
-    for i in range(len(x) - 1):
-        x0, x1 = x[i], x[i + 1]
-        y0, y1 = y[i], y[i + 1]
-        verts_x = [x0, x0, x1, x1]
-        verts_y = [0, y0, y1, 0]
-        plt.fill_between([x0, x1], [y0, y1], color="C0", alpha=0.2)
+    # Shade the trapezoids of all subintervals as one artist (works for either method visually)
+    plotting.shade_area(ax, x, y)
 
-    plt.xlabel("Time")
-    plt.ylabel("Temperature")
-    plt.title(f"Numerical integration ({method_name}) from points")
-    plt.legend()
-    plt.show()
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Temperature")
+    ax.set_title(f"Numerical integration ({method_name}) from points")
+    ax.legend()
+    return plotting.show(fig, name="integration")
 
 
+@plotting.renders
 def plot_function(f, a, b, h, method_name="trapezoidal"):
     """Plot a function over [a,b] and visualize composite rule used for integration.
 
@@ -147,6 +156,9 @@ def plot_function(f, a, b, h, method_name="trapezoidal"):
         b: end
         h: step size
         method_name: 'trapezoidal' or 'simpson'
+
+    Returns:
+        path of the saved plot file, or None when it opened in a window
     """
     N = n_from_step(a, b, h)
     xs = np.linspace(a, b, 400)
@@ -155,21 +167,20 @@ def plot_function(f, a, b, h, method_name="trapezoidal"):
     x_nodes = np.linspace(a, b, N + 1)
     y_nodes = f(x_nodes)
 
-    plt.figure(figsize=(8, 4))
-    plt.plot(xs, ys, label="f(x)")
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.plot(xs, ys, label="f(x)")
 
     # Draw trapezoids for visualization
-    for i in range(N):
-        x0, x1 = x_nodes[i], x_nodes[i + 1]
-        y0, y1 = y_nodes[i], y_nodes[i + 1]
-        plt.fill_between([x0, x1], [y0, y1], color="C0", alpha=0.2)
-
-    plt.scatter(x_nodes, y_nodes, color="k", zorder=3, label="nodes")
-    plt.xlabel("Time")
-    plt.ylabel("Temperature")
-    plt.title(f"Numerical integration ({method_name}) on [{a}, {b}] with h={h} (N={N})")
-    plt.legend()
-    plt.show()
+    aggregated = plotting.shade_area(ax, x_nodes, y_nodes)
+
+    # Individual nodes are indistinguishable once shading is aggregated per pixel
+    if not aggregated:
+        ax.scatter(x_nodes, y_nodes, color="k", zorder=3, label="nodes")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Temperature")
+    ax.set_title(f"Numerical integration ({method_name}) on [{a}, {b}] with h={h} (N={N})")
+    ax.legend()
+    return plotting.show(fig, name="integration")
 
 
 def plot(*args, **kwargs):
@@ -1,17 +1,21 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def divided_differences(X, Y):
-    """
-    Calculates the divided difference coefficients for Newton's form.
-    
-    Args:
-        X (list/np.array): x-coordinates of data points.
-        Y (list/np.array): y-coordinates of data points.
-        
-    Returns:
-        np.array: The coefficients (f[x0], f[x0, x1], f[x0, x1, x2], ...)
-    """
+import backends
+import downsampling
+import instrumentation
+import plotting
+
+# Largest number of data points accepted: the divided-difference table has n² entries
+# and Lagrange evaluation costs n² operations per point
+MAX_POINTS = 2000
+
+
+# =====================================================
+# REFERENCE KERNELS (pure Python/NumPy, JIT-compiled by the numba backend)
+# =====================================================
+
+def _divided_differences_kernel(X, Y):
     n = len(X)
     # Create the divided difference table (size n x n)
     F = np.zeros((n, n))
@@ -30,31 +34,19 @@ def divided_differences(X, Y):
     # The coefficients are the top diagonal of the table
     return F[0, :]
 
-def newton_interpolation(x, X, Y):
-    """
-    Evaluates the Newton interpolating polynomial at a given point x.
-    
-    Args:
-        x (float): The point at which to evaluate the polynomial.
-        X (list/np.array): x-coordinates of data points.
-        Y (list/np.array): y-coordinates of data points.
-        
-    Returns:
-        float: The interpolated value at x.
-    """
+
+def _newton_horner_kernel(x, X, coeffs):
     n = len(X)
-    coeffs = divided_differences(X, Y)
-    
     # Evaluate the Newton polynomial using Horner's method
     result = coeffs[-1]
     for k in range(n - 2, -1, -1):
         result = result * (x - X[k]) + coeffs[k]
-        
+
     return result
 
 
-def lagrange_interpolation(x, X, Y):
-    total = 0
+def _lagrange_kernel(x, X, Y):
+    total = 0.0
     n = len(X)
     for i in range(n):
         term = Y[i]
@@ -65,13 +57,83 @@ def lagrange_interpolation(x, X, Y):
     return total
 
 
+# Duplicate x values give inf/nan in the table (as NumPy does) rather than raising
+backends.register("divided_differences", _divided_differences_kernel, error_model="numpy")
+backends.register("newton_horner", _newton_horner_kernel, scalar_args=(0,))
+backends.register("lagrange", _lagrange_kernel, scalar_args=(0,))
+
+
+# =====================================================
+# INTERPOLATION
+# =====================================================
+
+def check_points(X) -> None:
+    """Reject data sets too large for the quadratic interpolation kernels."""
+    if len(X) > MAX_POINTS:
+        raise ValueError(
+            f"Interpolation accepts at most {MAX_POINTS:,} data points (got {len(X):,}). "
+            f"Use a window of the data around the time of interest (or the cooling estimate for large logs)."
+        )
+
+
+@instrumentation.timed
+def divided_differences(X, Y):
+    """
+    Calculates the divided difference coefficients for Newton's form.
+    
+    Args:
+        X (list/np.array): x-coordinates of data points.
+        Y (list/np.array): y-coordinates of data points.
+        
+    Returns:
+        np.array: The coefficients (f[x0], f[x0, x1], f[x0, x1, x2], ...)
+    """
+    check_points(X)
+    return backends.call("divided_differences", X, Y)
+
+@instrumentation.timed
+def newton_interpolation(x, X, Y):
+    """
+    Evaluates the Newton interpolating polynomial at a given point x.
+    
+    Args:
+        x (float): The point at which to evaluate the polynomial.
+        X (list/np.array): x-coordinates of data points.
+        Y (list/np.array): y-coordinates of data points.
+        
+    Returns:
+        float: The interpolated value at x.
+    """
+    coeffs = divided_differences(X, Y)
+    return newton_evaluate(x, X, coeffs)
+
+
+@instrumentation.timed
+def newton_evaluate(x, X, coeffs):
+    """Evaluates Newton's form at x from precomputed `divided_differences(X, Y)` coefficients."""
+    return backends.call("newton_horner", x, X, coeffs)
+
+
+@instrumentation.timed
+def lagrange_interpolation(x, X, Y):
+    """Evaluates the Lagrange interpolating polynomial at a given point x."""
+    check_points(X)
+    return backends.call("lagrange", x, X, Y)
+
+
+@plotting.renders
 def plot(X, Y, method):
     xs = np.linspace(min(X), max(X), 100)
     ys = [method(x, X, Y) for x in xs]
 
-    plt.scatter(X, Y, label="Data")
-    plt.plot(xs, ys, label="Interpolation / Extrapolation")
-    plt.xlabel("Time")
-    plt.ylabel("Temperature")   
-    plt.legend()
-    plt.show()
+    # Nodes may be given in any order; downsampling needs them sorted by time
+    order = np.argsort(X)
+    Xs, Ys = downsampling.downsample(np.asarray(X, dtype=float)[order], np.asarray(Y, dtype=float)[order])
+
+    fig, ax = plt.subplots()
+    ax.scatter(Xs, Ys, label=downsampling.label("Data", len(X), len(Xs)))
+    ax.plot(xs, ys, label="Interpolation / Extrapolation")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Temperature")
+    ax.legend()
+    return plotting.show(fig, name="interpolation")
@@ -0,0 +1,133 @@
+"""Memoized evaluation of model functions, shared per expression.
+
+Pressing several methods in turn evaluates the model at the same points again
+(f(x), f(x ± h) for the difference formulas, the same grid for trapezoid and
+Simpson, the plot grid for every "Show Plot"). `MemoizedFunction` caches those
+results: scalars are keyed by their exact float bits, arrays by dtype, shape and a
+digest of their bytes, so only bit-identical inputs hit. The cache is bounded by
+entry count and bytes and evicts the least recently used entries.
+
+`shared(expr)` returns one memoized, evaluation-counting function per model
+expression, so the screens, plot helpers and batch jobs reuse each other's
+evaluations. The byte limit is a budget for all shared caches of a process
+together: each of the `max_shared` expressions kept gets an equal part.
+
+    f = memo.shared(f_expr)
+    diff.central_difference(f, 1.0, 0.01)
+    diff.forward_difference(f, 1.0, 0.01)    # f(1.01) comes from the cache
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import derivatives
+import instrumentation
+
+config = {
+    "max_entries": int(os.environ.get("THERMAL_SIM_MEMO_ENTRIES", 4096)),
+    "max_bytes": int(os.environ.get("THERMAL_SIM_MEMO_BYTES", 64 * 2 ** 20)),  # per process
+    "max_shared": 32,  # expressions kept by shared(), each with max_bytes / max_shared
+}
+
+
+def _key(x):
+    """Cache key of an input: exact float bits for scalars, a digest for arrays."""
+    if isinstance(x, float):
+        return np.float64(x).tobytes()
+    x = np.asarray(x)
+    if x.ndim == 0:
+        return np.float64(x).tobytes()
+    x = np.ascontiguousarray(x)
+    digest = hashlib.blake2b(x.view(np.uint8), digest_size=16).digest()
+    return (x.dtype.str, x.shape, digest)
+
+
+class MemoizedFunction:
+    """Callable wrapper caching f(x) for scalar and array x with LRU eviction.
+
+    Cached arrays are returned read-only; copy them before modifying.
+    """
+
+    def __init__(self, f, max_entries=None, max_bytes=None):
+        self.f = f
+        self.__name__ = getattr(f, "__name__", "f")
+        self.max_entries = config["max_entries"] if max_entries is None else max_entries
+        self.max_bytes = config["max_bytes"] if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()  # key -> (value, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, x):
+        key = _key(x)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+        if entry is not None:
+            instrumentation.count_cache_hit()
+            return entry[0]
+
+        value = self.f(x)
+        if np.ndim(value) == 0:
+            value, nbytes = float(value), 8
+        else:
+            # Copy: the result may be a view of x (e.g. f(x) = x)
+            value = np.array(value, dtype=float)
+            value.flags.writeable = False
+            nbytes = value.nbytes
+
+        with self._lock:
+            self.misses += 1
+            if nbytes <= self.max_bytes and key not in self._cache:
+                self._cache[key] = (value, nbytes)
+                self._bytes += nbytes
+                while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+                    _, (_, evicted) = self._cache.popitem(last=False)
+                    self._bytes -= evicted
+        return value
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache), "bytes": self._bytes}
+
+
+_shared = OrderedDict()  # expression -> MemoizedFunction
+_shared_lock = threading.Lock()
+
+
+def shared(f) -> MemoizedFunction:
+    """The memoized, evaluation-counting function of a model (text or SymPy expression)."""
+    expr = derivatives.parse(f)
+    with _shared_lock:
+        func = _shared.get(expr)
+        if func is not None:
+            _shared.move_to_end(expr)
+            return func
+
+    func = MemoizedFunction(instrumentation.count_evaluations(derivatives.compile_function(expr)),
+                            max_bytes=config["max_bytes"] // config["max_shared"])
+    with _shared_lock:
+        func = _shared.setdefault(expr, func)
+        _shared.move_to_end(expr)
+        while len(_shared) > config["max_shared"]:
+            _shared.popitem(last=False)
+    return func
+
+
+def clear() -> None:
+    """Drop all shared caches."""
+    with _shared_lock:
+        _shared.clear()
@@ -0,0 +1,181 @@
+"""Non-blocking plot rendering.
+
+Plot helpers build their Matplotlib figure off-screen (Agg) and hand it to `show()`,
+which renders it with the active backend:
+
+- "window": the figure is pickled and opened by a separate Python process, so the
+  caller (e.g. the Textual event loop) never blocks and several plots can be open at once.
+- "file": the figure is saved as PNG/SVG into an output directory (headless servers, batch jobs).
+
+The backend defaults to "window" when a display is available and "file" otherwise.
+It can be chosen with `set_backend()` or the environment variables
+THERMAL_SIM_PLOT_BACKEND (window|file), THERMAL_SIM_PLOT_DIR and THERMAL_SIM_PLOT_FORMAT (png|svg).
+"""
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+
+if __name__ != "__main__":
+    # Figures are only ever drawn off-screen in the calling process
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+import downsampling
+
+BACKENDS = ("window", "file")
+FORMATS = ("png", "svg")
+
+# Above this many subintervals the integration shading is drawn as a per-pixel envelope
+SHADE_AGGREGATE_THRESHOLD = 2000
+
+
+def _has_display() -> bool:
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+config = {
+    "backend": os.environ.get("THERMAL_SIM_PLOT_BACKEND") or ("window" if _has_display() else "file"),
+    "output_dir": os.environ.get("THERMAL_SIM_PLOT_DIR", "plots"),
+    "format": os.environ.get("THERMAL_SIM_PLOT_FORMAT", "png"),
+}
+
+# pyplot keeps global state, so figure construction is serialized across worker threads
+_render_lock = threading.RLock()
+_viewers = []
+_counter = 0
+
+
+def set_backend(backend: str, output_dir=None, fmt=None) -> None:
+    """Select the plot backend ('window' or 'file') and, optionally, file output settings."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown plot backend '{backend}' (expected one of {BACKENDS})")
+    if fmt is not None and fmt not in FORMATS:
+        raise ValueError(f"Unknown plot format '{fmt}' (expected one of {FORMATS})")
+
+    config["backend"] = backend
+    if output_dir is not None:
+        config["output_dir"] = str(output_dir)
+    if fmt is not None:
+        config["format"] = fmt
+
+
+def renders(func):
+    """Decorator for plot helpers: holds the render lock while the figure is built and shown."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _render_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def show(fig, name: str = "plot"):
+    """Render a finished figure with the active backend and release it.
+
+    Returns:
+        str path of the written file for the 'file' backend, None for 'window'.
+    """
+    try:
+        if config["backend"] == "window":
+            _open_in_viewer(fig)
+            return None
+        return save(fig, name)
+    finally:
+        plt.close(fig)
+
+
+def save(fig, name: str = "plot") -> str:
+    """Save a figure into the configured output directory and return its path."""
+    global _counter
+
+    fmt = config["format"]
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown plot format '{fmt}' (expected one of {FORMATS})")
+
+    out_dir = Path(config["output_dir"])
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    _counter += 1
+    path = out_dir / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_counter}.{fmt}"
+    fig.savefig(path, format=fmt)
+    return str(path)
+
+
+def status_message(path, method_name: str) -> str:
+    """Human readable result of a plot request, for the screens' output panels."""
+    if path is None:
+        return f"📈 Plot opened in a separate window using the {method_name} method."
+    return f"📈 Plot using the {method_name} method saved to {path}"
+
+
+def shade_area(ax, x, y, color="C0", alpha=0.2):
+    """Shade the area between the piecewise-linear curve through (x, y) and zero.
+
+    Up to SHADE_AGGREGATE_THRESHOLD subintervals this is one filled polygon, identical
+    to drawing every trapezoid. Above it the shading becomes a per-pixel-column min/max
+    envelope, so drawing cost is bounded by the axes width instead of the data size.
+
+    Returns:
+        True if the aggregated envelope was drawn, False otherwise.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if len(x) - 1 <= SHADE_AGGREGATE_THRESHOLD:
+        ax.fill_between(x, y, color=color, alpha=alpha)
+        return False
+
+    columns = max(1, int(ax.get_window_extent().width))
+    edges, lo, hi = downsampling.bucket_envelope(x, y, columns)
+
+    # The shaded region always reaches down (or up) to zero
+    lo = np.minimum(lo, 0.0)
+    hi = np.maximum(hi, 0.0)
+
+    ax.fill_between(
+        np.append(edges, x[-1]), np.append(lo, lo[-1]), np.append(hi, hi[-1]),
+        step="post", color=color, alpha=alpha, linewidth=0,
+        label=f"Area envelope ({len(x) - 1} intervals)",
+    )
+    return True
+
+
+def _open_in_viewer(fig) -> None:
+    # Reap viewers whose windows were closed
+    _viewers[:] = [p for p in _viewers if p.poll() is None]
+
+    with tempfile.NamedTemporaryFile(suffix=".pickle", delete=False) as fh:
+        pickle.dump(fig, fh)
+
+    _viewers.append(subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), fh.name],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ))
+
+
+# =====================================================
+# VIEWER PROCESS
+# =====================================================
+
+def _view(pickle_path: str) -> None:
+    with open(pickle_path, "rb") as fh:
+        pickle.load(fh)  # unpickling re-registers the figure with pyplot
+    os.remove(pickle_path)
+    plt.show()
+
+
+if __name__ == "__main__":
+    _view(sys.argv[1])
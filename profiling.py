@@ -0,0 +1,231 @@
+"""Per-action profiling of the app (enabled with `python screens/main.py --profile`).
+
+Every button press is one action. Its work on the UI thread and in the worker
+thread it starts (computation or plot) is run under cProfile, and the profiles are
+accumulated per action label together with the press-to-result latency:
+
+    action = profiling.begin("Integration: Simpson's 1/3 Rule")
+    with profiling.profile(action):
+        ...                                  # may run in another thread
+    profiling.finish(action)
+
+`hot_functions()` lists the functions with the most own time, `breakdown()` sums
+that time per library (SymPy, lambdify-generated code, NumPy, matplotlib, ...) and
+`export()` writes .prof files for offline tools (`snakeviz profiles/all.prof`).
+Nothing is profiled unless enabled (flag, `config` or THERMAL_SIM_PROFILE=1).
+
+Only one profiler can be active at a time on Python 3.12+, so an action that
+overlaps another one may not get a profile; its latency is still recorded and it
+is counted as "not profiled" in `actions()`.
+"""
+import cProfile
+import os
+import pstats
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+config = {
+    "enabled": os.environ.get("THERMAL_SIM_PROFILE", "") not in ("", "0"),
+    "output_dir": os.environ.get("THERMAL_SIM_PROFILE_DIR", "profiles"),
+    "max_latencies": 1000,  # latencies kept per action
+}
+
+# Latency histogram bin edges in seconds
+LATENCY_BINS = (0.0, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, np.inf)
+
+# Library of a profiled function, matched against its file name (first match wins)
+LIBRARIES = (
+    ("lambdify", re.compile(r"<lambdifygenerated")),
+    ("sympy", re.compile(r"[/\\]sympy[/\\]")),
+    ("numpy", re.compile(r"[/\\]numpy[/\\]")),
+    ("matplotlib", re.compile(r"[/\\](matplotlib|PIL)[/\\]")),
+    ("numba", re.compile(r"[/\\](numba|llvmlite)[/\\]")),
+    ("textual", re.compile(r"[/\\](textual|rich)[/\\]")),
+    ("imports", re.compile(r"^<frozen importlib")),
+    ("python", re.compile(r"^~$|[/\\]lib[/\\]python3[^/\\]*[/\\](?!site-packages)")),
+)
+
+_stats = {}  # label -> accumulated pstats.Stats
+_latencies = {}  # label -> deque of seconds
+_unprofiled = {}  # label -> actions with a part that could not be profiled
+_lock = threading.Lock()
+
+
+class Action:
+    """One button action: its label and start time."""
+
+    def __init__(self, label):
+        self.label = label
+        self.start = time.perf_counter()
+        self.unprofiled = False
+
+
+def enable(on: bool = True) -> None:
+    config["enabled"] = on
+
+
+def begin(label: str):
+    """Start timing an action; returns None when profiling is disabled."""
+    return Action(label) if config["enabled"] else None
+
+
+@contextmanager
+def profile(action):
+    """Run the block under cProfile and add the profile to the action's statistics."""
+    if action is None:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is active in this interpreter (Python 3.12+)
+        action.unprofiled = True
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.disable()
+        with _lock:
+            stats = _stats.get(action.label)
+            if stats is None:
+                _stats[action.label] = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+
+
+def finish(action) -> None:
+    """Record the latency of a finished action (from begin() until now)."""
+    if action is None:
+        return
+    seconds = time.perf_counter() - action.start
+    with _lock:
+        _latencies.setdefault(action.label, deque(maxlen=config["max_latencies"])).append(seconds)
+        if action.unprofiled:
+            _unprofiled[action.label] = _unprofiled.get(action.label, 0) + 1
+
+
+def reset() -> None:
+    with _lock:
+        _stats.clear()
+        _latencies.clear()
+        _unprofiled.clear()
+
+
+# =====================================================
+# REPORTS
+# =====================================================
+
+def actions() -> dict:
+    """Per action label: count, unprofiled count, mean, p50, p90 and max latency in seconds."""
+    with _lock:
+        latencies = {label: np.array(values) for label, values in _latencies.items()}
+        unprofiled = dict(_unprofiled)
+    return {
+        label: {
+            "count": len(values),
+            "unprofiled": unprofiled.get(label, 0),
+            "mean": float(values.mean()),
+            "p50": float(np.percentile(values, 50)),
+            "p90": float(np.percentile(values, 90)),
+            "max": float(values.max()),
+        }
+        for label, values in latencies.items()
+    }
+
+
+def histogram(label: str):
+    """Latency counts of an action in LATENCY_BINS: list of (low, high, count)."""
+    with _lock:
+        values = list(_latencies.get(label, ()))
+    counts, _ = np.histogram(values, bins=LATENCY_BINS)
+    return [(LATENCY_BINS[i], LATENCY_BINS[i + 1], int(c)) for i, c in enumerate(counts)]
+
+
+def _combined(label=None):
+    """Accumulated stats of one action, or of all actions when label is None."""
+    with _lock:
+        if label is not None:
+            parts = [_stats[label]] if label in _stats else []
+        else:
+            parts = list(_stats.values())
+        if not parts:
+            return None
+        combined = pstats.Stats()
+        combined.add(*parts)
+    return combined
+
+
+def _library(stats, func, depth=3) -> str:
+    filename = func[0]
+    if filename == "~" and depth:
+        # Built-in functions have no file: count them for the library calling them most
+        callers = stats.stats[func][4]
+        if callers:
+            caller = max(callers, key=lambda c: callers[c][2])
+            if caller in stats.stats:
+                return _library(stats, caller, depth - 1)
+    for name, pattern in LIBRARIES:
+        if pattern.search(filename):
+            return name
+    return "app"
+
+
+def hot_functions(label=None, top: int = 15):
+    """Functions with the most own time: list of dicts (function, library, calls, own, cumulative)."""
+    stats = _combined(label)
+    if stats is None:
+        return []
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return [
+        {
+            "function": f"{Path(filename).name}:{line}({name})" if filename != "~" else name,
+            "library": _library(stats, (filename, line, name)),
+            "calls": calls,
+            "own": own,
+            "cumulative": cumulative,
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in rows
+    ]
+
+
+def breakdown(label=None) -> dict:
+    """Own time in seconds summed per library, largest first."""
+    stats = _combined(label)
+    if stats is None:
+        return {}
+    totals = {}
+    for func, (_, _, own, _, _) in stats.stats.items():
+        library = _library(stats, func)
+        totals[library] = totals.get(library, 0.0) + own
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _file_name(label: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_").lower() + ".prof"
+
+
+def export(output_dir=None) -> list:
+    """Write all.prof and one .prof per action (pstats format); returns the paths."""
+    output_dir = Path(output_dir or config["output_dir"])
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with _lock:
+        labels = list(_stats)
+    paths = []
+    for label in [None] + labels:
+        stats = _combined(label)
+        if stats is None:
+            continue
+        path = output_dir / ("all.prof" if label is None else _file_name(label))
+        stats.dump_stats(path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,155 @@
+import sys
+from functools import lru_cache, wraps
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textual.worker import NoActiveWorker, get_current_worker
+
+import derivatives
+import memo
+import plotting
+import profiling
+
+LIVE_DELAY = 0.35  # seconds of no typing before a live preview is computed
+
+
+def show_plot(screen, plot_func, *args, label="", output=None, **kwargs):
+    """Render a plot in a worker thread so the screen stays responsive.
+
+    The result (window opened or file path) is reported in `output` (default `screen.output`).
+    """
+    output = output or screen.output
+    action = _take_action(screen)
+
+    def render():
+        try:
+            with profiling.profile(action):
+                path = plot_func(*args, **kwargs)
+            message = plotting.status_message(path, label)
+        except Exception as e:
+            message = f"❌ **Error:** Could not render plot.\nDetails: {e}"
+        screen.app.call_from_thread(output.update, message)
+        profiling.finish(action)
+
+    output.update("⏳ Rendering plot...")
+    screen.run_worker(render, thread=True, group="plot", exit_on_error=False)
+
+
+# =====================================================
+# LIVE PREVIEW
+# =====================================================
+
+@lru_cache(maxsize=64)
+def parse_model(f_str: str):
+    """Parse a SymPy-syntax model once: (expression, memoized vectorized f)."""
+    f_expr = derivatives.parse(f_str)
+    return f_expr, memo.shared(f_expr)
+
+
+def cancelled() -> bool:
+    """True inside a compute worker that a newer run has superseded."""
+    try:
+        return get_current_worker().is_cancelled
+    except NoActiveWorker:
+        return False
+
+
+def run_compute(screen, compute, error_text, output=None, group="compute"):
+    """Run `compute()` in an exclusive thread worker and show the text it returns.
+
+    The UI stays responsive while the work runs (in-process, or in the shared pool
+    when served). Starting a run cancels the previous one in the same group, whose
+    result is then discarded; `error_text(e)` formats exceptions.
+
+    `compute()` may return (text, apply) instead of text: `apply()` then runs on the
+    UI thread just before the text is shown, so screen state (last method, plot data,
+    history) is only updated by runs that were not superseded.
+    """
+    output = output or screen.output
+    action = _take_action(screen)
+
+    def show(worker, result):
+        if worker.is_cancelled:
+            return  # a newer run replaced this one while it was finishing
+        text, apply = result if isinstance(result, tuple) else (result, None)
+        if apply is not None:
+            apply()
+        output.update(text)
+
+    def work():
+        worker = get_current_worker()
+        try:
+            with profiling.profile(action):
+                result = compute()
+        except Exception as e:
+            result = error_text(e)
+        if result is not None and not worker.is_cancelled:
+            screen.app.call_from_thread(show, worker, result)
+        profiling.finish(action)
+
+    screen.run_worker(work, thread=True, group=group, exclusive=True, exit_on_error=False)
+
+
+def _live_error(e):
+    lines = str(e).splitlines()
+    return f"⏸ Live preview: {lines[0] if lines else type(e).__name__}"
+
+
+def schedule_live(screen, prepare, output=None, delay=LIVE_DELAY):
+    """Debounced live recompute after an input change.
+
+    Each call restarts the timer. When it fires, `prepare()` runs on the UI thread to
+    read the inputs and returns a zero-argument compute callable (or None to skip).
+    The compute runs with `run_compute`, so a newer preview cancels an older one.
+    """
+    cancel_live(screen)
+
+    def start():
+        compute = prepare()
+        if compute is not None:
+            run_compute(screen, compute, _live_error, output=output, group="live")
+
+    screen._live_timer = screen.set_timer(delay, start)
+
+
+def cancel_live(screen):
+    """Drop a pending or running live preview (e.g. when a button computes explicitly)."""
+    timer = getattr(screen, "_live_timer", None)
+    if timer is not None:
+        timer.stop()
+        screen._live_timer = None
+    screen.workers.cancel_group(screen, "live")
+
+
+# =====================================================
+# PROFILING (--profile)
+# =====================================================
+
+def profiled(handler):
+    """Decorator for a screen's on_button_pressed: profile each press as one action.
+
+    The handler runs under the profiler; when it starts a compute or plot worker,
+    the worker's run is added to the same action and the latency ends with its result.
+    """
+    @wraps(handler)
+    def wrapper(screen, event):
+        name = type(screen).__name__.removesuffix("Screen")
+        action = profiling.begin(f"{name}: {event.button.label}")
+        if action is None:
+            return handler(screen, event)
+
+        screen._profile_action = action
+        try:
+            with profiling.profile(action):
+                return handler(screen, event)
+        finally:
+            if _take_action(screen) is action:  # no worker took the action over
+                profiling.finish(action)
+
+    return wrapper
+
+
+def _take_action(screen):
+    action = getattr(screen, "_profile_action", None)
+    screen._profile_action = None
+    return action
@@ -1,13 +1,30 @@
 from textual.screen import Screen
-from textual.widgets import Label, Input, Button, Static
+from textual.widgets import Label, Input, Button, Static, Checkbox
 from textual.containers import VerticalScroll
 import sys
+from functools import lru_cache
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+import derivatives
 import differentiation as diff 
+import common
 import utils
+import instrumentation
 import sympy as sp
 
+# Button id -> (difference formula, display name, history key)
+METHODS = {
+    "compute_backward": (diff.backward_difference, "Backward Divided Difference", "backward"),
+    "compute_forward": (diff.forward_difference, "Forward Divided Difference", "forward"),
+    "compute_central": (diff.central_difference, "Central Divided Difference", "central"),
+}
+
+
+@lru_cache(maxsize=64)
+def _derivative(f_expr):
+    """Symbolic derivative and its compiled callable, computed once per model."""
+    return sp.diff(f_expr, derivatives.X_SYMBOL), derivatives.compile_derivative(f_expr)
+
 
 class DifferentiationScreen(Screen):
     CSS_PATH = str(Path(__file__).parent / "static_and_label.tcss")
@@ -46,6 +63,8 @@ class DifferentiationScreen(Screen):
             yield Button("Cooling / Heating Rate (dT/dt) using Forward Divided Difference", id="compute_forward")
             yield Button("Cooling / Heating Rate (dT/dt) using Central Divided Difference", id="compute_central")
             yield Button("Show Plot", id="show_plot")
+            self.live_checkbox = Checkbox("Live preview (recompute the last method while typing)", value=True, id="live")
+            yield self.live_checkbox
 
             yield Label("---") 
             yield Button("Back to Main Menu", id="back_to_main")
@@ -53,89 +72,16 @@ class DifferentiationScreen(Screen):
             self.output = Static("Waiting for input...", classes="status")
             yield self.output
 
+    @common.profiled
     def on_button_pressed(self, event):
         if event.button.id == "back_to_main":
             self.app.pop_screen()
             return
-        
-        
+
+        common.cancel_live(self)
         try:
-            # Parse the data points X and H
-            X = float(self.x_data_input.value)
-            H = float(self.h_data_input.value)
-            
-            # Convert the function string input into a callable function
-            f_str = self.f_data_input.value
-
-            # Symbolic (True) differentiation setup
-            # Define the symbol 'x' for SymPy
-            x_sym = sp.symbols('x') 
-
-            # Attempt to parse the user's input as a SymPy expression.
-            # If the user prepended 'np.' (from NumPy), try to strip it before parsing.
-            if 'np.' in f_str:
-                # Convert np.sin(x) -> sin(x) for SymPy parsing
-                f_str_for_sympy = f_str.replace('np.', '')
-            else:
-                f_str_for_sympy = f_str
-
-            # Convert the user's string to a SymPy expression
-            f_expr = sp.sympify(f_str_for_sympy)
-
-            # Symbolic derivative expression
-            df_expr = sp.diff(f_expr, x_sym)
-
-            # Convert SymPy expressions into NumPy-callable functions for numerical work and evaluation
-            f_np = sp.lambdify(x_sym, f_expr, 'numpy')
-            f_prime_np = sp.lambdify(x_sym, df_expr, 'numpy')
-
-            # Calculate the exact derivative value at point X
-            exact_value = float(f_prime_np(X))
-
-            approx_value = 0
-            method_name = ""
-
-            if event.button.id == "compute_backward":
-                approx_value = diff.backward_difference(f_np, X, H)
-                method_name = "Backward Divided Difference"
-                utils.latest_results["method_b"] = approx_value
-                utils.latest_results["description"] = "Symbolic vs Backward Divided Difference"
-                # Store the last used method for plotting
-                self.last_method = diff.backward_difference 
-                self.last_method_name = method_name
-
-            elif event.button.id == "compute_forward":
-                approx_value = diff.forward_difference(f_np, X, H)
-                method_name = "Forward Divided Difference"
-                utils.latest_results["method_b"] = approx_value
-                utils.latest_results["description"] = "Symbolic vs Forward Divided Difference"
-                # Store the last used method for plotting
-                self.last_method = diff.forward_difference 
-                self.last_method_name = method_name
-            
-            elif event.button.id == "compute_central":
-                approx_value = diff.central_difference(f_np, X, H)
-                method_name = "Central Divided Difference"
-                utils.latest_results["method_b"] = approx_value
-                utils.latest_results["description"] = "Symbolic vs Central Divided Difference"
-                # Store the last used method for plotting
-                self.last_method = diff.central_difference 
-                self.last_method_name = method_name
-                
-
-            # Calculate the relative error (after approx_value set)
-            relative_err = utils.relative_error(approx_value, exact_value)
-
-            utils.latest_results["method_a"] = exact_value
-
-            # Determine Heating or Cooling state
-            state = "Stable"
-
-            if (approx_value > 0 or exact_value > 0):
-                state = "Heating"
-            elif (approx_value < 0 or exact_value < 0):
-                state = "Cooling"
-            
+            inputs = self._read_inputs()
+
             if event.button.id == "show_plot":
                 # Check if a method was previously computed and stored
                 if not hasattr(self, 'last_method'):
@@ -143,24 +89,100 @@ class DifferentiationScreen(Screen):
                      return # Exit function before formatting block
 
                 # Use the last computed method for plotting
-                diff.plot(f_np, X, H, self.last_method)
-                self.output.update(f"📈 Plot opened in a separate window using the {self.last_method_name} method.")
+                f_str, X, H = inputs
+                f_expr, f_np = common.parse_model(f_str)
+                _, f_prime_np = _derivative(f_expr)
+                common.show_plot(self, diff.plot, f_np, X, H, self.last_method,
+                                 exact=f_prime_np, label=self.last_method_name)
                 return
 
-            output_text = (
-                f"Method: {method_name}\n"
-                f"Temperature at Time x, Function f(x) = {f_expr}\n"
-                f"Rate of Temperature Change, True Derivative f'(x) = {df_expr}\n"
-                f"--- \n"
-                f"At Time={X} with Time Interval={H}:\n"
-                f"Approximate Rate of Temperature Change ≈ {approx_value:0.8f}\n"
-                f"Exact Rate of Temperature Change = {exact_value:0.8f}\n"
-                f"Relative Error: {relative_err:0.4e}\n"
-                f"The body is currently: {state} at a rate of {approx_value:0.8f} (°C/s)\n"
-            )
-            self.output.update(output_text)
+        except Exception as e:
+            self.output.update(self._error_text(e))
+            return
 
-        except (ValueError, NameError, TypeError, SyntaxError, sp.SympifyError) as e:
+        self.output.update("⏳ Computing...")
+        common.run_compute(self, lambda: self._compute(event.button.id, *inputs, record=True), self._error_text)
+
+    @staticmethod
+    def _error_text(e):
+        if isinstance(e, (ValueError, NameError, TypeError, SyntaxError, sp.SympifyError)):
             # Catches errors from float conversion, or eval() parsing the function string
-            error_message = f"❌ **Error:** Invalid input.\nDetails: {e}"
-            self.output.update(error_message)
\ No newline at end of file
+            return f"❌ **Error:** Invalid input.\nDetails: {e}"
+        return f"❌ **Error:** {e}"
+
+    def on_input_changed(self, event):
+        if self.live_checkbox.value:
+            common.schedule_live(self, self._prepare_live)
+
+    # =====================================================
+    # COMPUTATION
+    # =====================================================
+
+    def _read_inputs(self):
+        # Parse the data points X and H
+        X = float(self.x_data_input.value)
+        H = float(self.h_data_input.value)
+        return self.f_data_input.value, X, H
+
+    def _prepare_live(self):
+        """Inputs for a live preview, or None while any of them is incomplete."""
+        try:
+            inputs = self._read_inputs()
+        except ValueError:
+            return None
+        if not inputs[0].strip():
+            return None
+        method_id = getattr(self, "live_method", None)
+        if method_id is None:
+            return None  # nothing to preview until a method has been run once
+        return lambda: self._compute(method_id, *inputs, record=False)
+
+    def _compute(self, method_id, f_str, X, H, record):
+        """Run one difference formula; parsing and the exact reference are cached per model."""
+        method, method_name, method_key = METHODS[method_id]
+
+        # Parse once per model string (np. prefixes are stripped); f is memoized and counted
+        f_expr, f_np = common.parse_model(f_str)
+
+        # Symbolic derivative expression and the exact derivative value at point X
+        df_expr, f_prime_np = _derivative(f_expr)
+        exact_value = float(f_prime_np(X))
+        if common.cancelled():
+            return None
+
+        with instrumentation.collect(method_id) as metrics:
+            approx_value = method(f_np, X, H)
+        runtime = metrics.seconds
+
+        # Calculate the relative error (after approx_value set)
+        relative_err = utils.relative_error(approx_value, exact_value)
+
+        def apply():
+            # Store the last used method for plotting (and for the live preview)
+            self.last_method = method
+            self.last_method_name = method_name
+            self.live_method = method_id
+            if record:
+                self.app.history.record(method_key, exact_value, approx_value, h=H, runtime=runtime)
+
+        # Determine Heating or Cooling state
+        state = "Stable"
+
+        if (approx_value > 0 or exact_value > 0):
+            state = "Heating"
+        elif (approx_value < 0 or exact_value < 0):
+            state = "Cooling"
+
+        return (
+            f"Method: {method_name}{'' if record else ' (live preview)'}\n"
+            f"Temperature at Time x, Function f(x) = {f_expr}\n"
+            f"Rate of Temperature Change, True Derivative f'(x) = {df_expr}\n"
+            f"--- \n"
+            f"At Time={X} with Time Interval={H}:\n"
+            f"Approximate Rate of Temperature Change ≈ {approx_value:0.8f}\n"
+            f"Exact Rate of Temperature Change = {exact_value:0.8f}\n"
+            f"Relative Error: {relative_err:0.4e}\n"
+            f"The body is currently: {state} at a rate of {approx_value:0.8f} (°C/s)\n"
+            f"--- \n"
+            f"{metrics.summary()}"
+        ), apply
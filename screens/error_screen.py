@@ -1,10 +1,25 @@
 from textual.screen import Screen
-from textual.widgets import Label, Button, Static
+from textual.widgets import Label, Button, Static, Input
 from textual.containers import VerticalScroll
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+import compute
+import convergence
+import differentiation as diff
+import integration as integ
 import utils
+import common
+import sympy as sp
+
+# Convergence study buttons: id -> (kind, method, label)
+STUDIES = {
+    "conv_backward": ("diff", diff.backward_difference, "Backward Divided Difference"),
+    "conv_forward": ("diff", diff.forward_difference, "Forward Divided Difference"),
+    "conv_central": ("diff", diff.central_difference, "Central Divided Difference"),
+    "conv_trap": ("integ", integ.trapezoidal_rule, "Trapezoidal Rule"),
+    "conv_simp": ("integ", integ.simpsons_rule, "Simpson's 1/3 Rule"),
+}
 
 class ErrorScreen(Screen):
     CSS_PATH = str(Path(__file__).parent / "static_and_label.tcss")
@@ -12,12 +27,54 @@ class ErrorScreen(Screen):
 
     def compose(self):
 
+        # VerticalScroll guarantees scrolling
+        with VerticalScroll(id="menu-container"):
+
             yield Label("Error Analysis Results", id="title")
             yield Label("Comparison of Numerical Results")
 
             self.output = Static("No data available.", id="error_output")
             yield self.output
 
+            yield Label("History of All Computations")
+            self.history_output = Static("", id="history_output")
+            yield self.history_output
+
+            yield Button("Export History (CSV)", id="export_history")
+
+            # -------- Convergence Study --------
+            yield Label("Convergence Study (error vs. time step h)")
+            yield Static(
+                "Sweeps h0, h0/r, h0/r², ... and fits the observed order of accuracy.\n"
+                "Differentiation uses Time x; integration uses Start/End Time (r = 2).",
+                classes="status",
+            )
+            self.conv_f_input = Input(placeholder="Temperature Model f(x) (SymPy format, e.g., exp(-0.1*x))")
+            self.conv_x_input = Input(placeholder="Time x for differentiation (e.g., 1.0)")
+            self.conv_a_input = Input(placeholder="Start Time for integration (e.g., 0)")
+            self.conv_b_input = Input(placeholder="End Time for integration (e.g., 10)")
+            self.conv_h_input = Input(placeholder="Initial time step h0 (e.g., 0.5)")
+            self.conv_steps_input = Input(placeholder=f"Number of step sizes (default {convergence.DEFAULT_COUNT}, at most {convergence.MAX_COUNT})")
+            self.conv_ratio_input = Input(placeholder="Step ratio r for differentiation (default 2)")
+            yield self.conv_f_input
+            yield self.conv_x_input
+            yield self.conv_a_input
+            yield self.conv_b_input
+            yield self.conv_h_input
+            yield self.conv_steps_input
+            yield self.conv_ratio_input
+
+            yield Button("Convergence: Backward Divided Difference", id="conv_backward")
+            yield Button("Convergence: Forward Divided Difference", id="conv_forward")
+            yield Button("Convergence: Central Divided Difference", id="conv_central")
+            yield Button("Convergence: Trapezoidal Rule", id="conv_trap")
+            yield Button("Convergence: Simpson's 1/3 Rule", id="conv_simp")
+            yield Button("Show Convergence Plot", id="conv_plot")
+
+            self.conv_output = Static("", id="convergence_output")
+            yield self.conv_output
+
+            yield Label("---")
             yield Button("Back to Main Menu", id="back_to_main")
             # Only one output widget should exist; keep the initial one above
 
@@ -25,23 +82,24 @@ class ErrorScreen(Screen):
     async def on_mount(self):
 
         """Populate the error analysis when screen loads."""
-        # Debug message to confirm the handler runs when the screen mounts
-        print("[debug] ErrorScreen.on_mount called")
-
-        a = utils.latest_results.get("method_a")
-        b = utils.latest_results.get("method_b")
-        desc = utils.latest_results.get("description", "")
+        latest = self.app.history.latest()
 
-        if a is None or b is None:
+        if latest is None:
             # Update the existing output widget
             self.output.update("⚠️  No numerical results available for error analysis. Please perform computations first.")
+            self.history_output.update("No computations recorded yet.")
             return
 
+        a = latest["exact"]
+        b = latest["approx"]
+        desc = latest["description"]
+
         abs_error = utils.absolute_error(a, b)
         rel_error = utils.relative_error(a, b) if b != 0 else float("inf")
 
         loss_msg = ""
-        if abs_error < 1e-6 and abs(a) > 1:
+        # Interpolation cross-checks agree by design: no exact value to lose significance against
+        if abs_error < 1e-6 and abs(a) > 1 and latest["method"] not in utils.REFERENCES:
             loss_msg = "\n⚠️    Possible loss of significance detected."
 
         rel_error_percent = rel_error * 100 if b != 0 else float("inf")
@@ -49,14 +107,111 @@ class ErrorScreen(Screen):
         # Update the already-mounted widget instead of creating a new one
         self.output.update(
             f"{desc}\n\n"
-            f"Symbolic Calculation Result: {a:.6f}\n"
+            f"{latest['reference']} Calculation Result: {a:.6f}\n"
             f"Numerical Calculation Result: {b:.6f}\n\n"
             f"Temperature Error (°C): {abs_error:.6e}\n"
             f"Thermal Model Deviation (%): {rel_error:.6e}, ({rel_error_percent}%)\n"
             f"{loss_msg}"
         )
-
-
+        self.history_output.update(self._format_history(self.app.history.summary()))
+
+    def _format_history(self, summary):
+        lines = [f"Recorded computations: {summary['count']} (last {self.app.history.capacity} kept)"]
+
+        if "abs_error_percentiles" in summary:
+            p = summary["abs_error_percentiles"]
+            lines.append(f"Temperature Error percentiles: p50={p[50]:.3e}  p90={p[90]:.3e}  p99={p[99]:.3e}")
+        if "rel_error_percentiles" in summary:
+            p = summary["rel_error_percentiles"]
+            lines.append(f"Relative Error percentiles:    p50={p[50]:.3e}  p90={p[90]:.3e}  p99={p[99]:.3e}")
+
+        lines.append("")
+        lines.append(f"{'Method':<36}{'Runs':>6}{'Median |err|':>14}{'Max |err|':>12}{'Mean rel':>12}")
+        for label, stats in summary["methods"].items():
+            lines.append(
+                f"{label:<36}{stats['count']:>6}{stats['median_abs_error']:>14.3e}"
+                f"{stats['max_abs_error']:>12.3e}{stats['mean_rel_error']:>12.3e}"
+            )
+
+        histogram = summary.get("abs_error_histogram")
+        if histogram:
+            lines.append("")
+            lines.append("Temperature Error distribution (by decade):")
+            peak = max(histogram.values())
+            for exponent, count in histogram.items():
+                bar = "█" * max(1, round(20 * count / peak))
+                lines.append(f"  1e{exponent:+03d} … 1e{exponent + 1:+03d}  {bar} {count}")
+        if summary.get("exact_matches"):
+            lines.append(f"  exact matches (error = 0): {summary['exact_matches']}")
+
+        return "\n".join(lines)
+
+
+    @common.profiled
     def on_button_pressed(self, event):
         if event.button.id == "back_to_main":
-            self.app.pop_screen()
\ No newline at end of file
+            self.app.pop_screen()
+        elif event.button.id == "export_history":
+            if len(self.app.history) == 0:
+                self.history_output.update("⚠️  Nothing to export yet.")
+                return
+            # Served sessions share the working directory: one file per session
+            name = f"results_history-{compute.config['session']}.csv" if compute.config["address"] else "results_history.csv"
+            path = self.app.history.export(Path.cwd() / name)
+            self.history_output.update(
+                self._format_history(self.app.history.summary()) + f"\n\n💾 History exported to {path}"
+            )
+        elif event.button.id == "conv_plot":
+            if not hasattr(self, "last_study"):
+                self.conv_output.update("❌ **Error:** Please run a convergence study first before plotting.")
+                return
+            study, label = self.last_study
+            common.show_plot(self, convergence.plot, study, f"Convergence of {label}",
+                             label=label, output=self.conv_output)
+        elif event.button.id in STUDIES:
+            try:
+                inputs = self._read_study_inputs(STUDIES[event.button.id][0])
+            except ValueError as e:
+                self.conv_output.update(self._study_error_text(e))
+                return
+            self.conv_output.update("⏳ Computing...")
+            common.run_compute(self, lambda: self._run_study(*STUDIES[event.button.id], **inputs),
+                               self._study_error_text, output=self.conv_output)
+
+    @staticmethod
+    def _study_error_text(e):
+        if isinstance(e, (ValueError, TypeError, SyntaxError, ZeroDivisionError, sp.SympifyError)):
+            return f"❌ **Error:** Invalid input.\nDetails: {e}"
+        return f"❌ **Error:** {e}"
+
+    def _read_study_inputs(self, kind):
+        """Study inputs, read on the UI thread, as keyword arguments of _run_study."""
+        inputs = {
+            "f_str": self.conv_f_input.value,
+            "h0": float(self.conv_h_input.value),
+            "count": int(self.conv_steps_input.value or convergence.DEFAULT_COUNT),
+        }
+        if kind == "diff":
+            inputs["x0"] = float(self.conv_x_input.value)
+            inputs["ratio"] = float(self.conv_ratio_input.value or 2)
+        else:
+            inputs["a"] = float(self.conv_a_input.value)
+            inputs["b"] = float(self.conv_b_input.value)
+        return inputs
+
+    def _run_study(self, kind, method, label, f_str, h0, count, x0=None, ratio=2.0, a=None, b=None):
+        """Run one study (in a worker thread, shared pool when served); returns the report and the plot state."""
+        f_expr = sp.sympify(f_str.strip().replace("np.", ""))
+        exact, study = compute.call(convergence.run_study, kind, method, f_expr, h0, count, x0, ratio, a, b)
+        where = f"at Time x = {x0}" if kind == "diff" else f"on [{a}, {b}]"
+
+        def apply():
+            self.last_study = (study, label)
+
+        return (
+            f"Method: {label}\n"
+            f"Temperature Model = {f_expr} {where}\n"
+            f"Exact Result: {exact:.10f}\n"
+            f"---\n"
+            + convergence.format_table(study)
+        ), apply
\ No newline at end of file
@@ -1,15 +1,57 @@
 from textual.screen import Screen
-from textual.widgets import Label, Input, Button, Static
+from textual.widgets import Label, Input, Button, Static, Checkbox
 from textual.containers import VerticalScroll
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import numpy as np
-import sympy as sp
 
+import compute
+import dataio
+import derivatives
 import integration as integ
+import instrumentation
 import utils
+import common
+
+# Button id -> (rule for f(x), rule for points, display name, history key)
+METHODS = {
+    "trap": (integ.trapezoidal_rule, integ.trapezoidal_from_points, "Trapezoidal Rule", "trapezoid"),
+    "simp": (integ.simpsons_rule, integ.simpsons_from_points, "Simpson's 1/3 Rule", "simpson"),
+}
+
+
+@lru_cache(maxsize=8)
+def _points(x_text, y_text, path, mtime):
+    """Parsed, validated and sorted data points; reused until an input (or the file) changes."""
+    if path:
+        X, Y = dataio.load_columns(path)
+    else:
+        X = dataio.parse_values(x_text)
+        Y = dataio.parse_values(y_text)
+
+    if len(X) != len(Y):
+        raise ValueError("Time and Temperature must have the same number of values.")
+    if len(X) < 2:
+        raise ValueError("At least two data points are required.")
+
+    order = np.argsort(X)
+    X = X[order]
+    Y = Y[order]
+
+    if np.any(np.diff(X) <= 0):
+        raise ValueError("Time values must be strictly increasing.")
+
+    return X, Y
+
+
+@lru_cache(maxsize=64)
+def _exact_integral(f_expr, a, b):
+    """Symbolic integral of the model over [a, b] (the expensive step, computed once)."""
+    return compute.call(derivatives.integrate, f_expr, a, b)
 
 
 class IntegrationScreen(Screen):
@@ -34,8 +76,10 @@ class IntegrationScreen(Screen):
             yield Label("Mode A: Experimental Data (Time and Temperature values)")
             self.x_input = Input(placeholder="Time values (s) (e.g., 0, 1, 2, 3)")
             self.y_input = Input(placeholder="Temperature values (°C) (e.g., 0, 1, 4, 9)")
+            self.file_input = Input(placeholder="...or data file (CSV/NPY/NPZ) with time and temperature columns")
             yield self.x_input
             yield self.y_input
+            yield self.file_input
 
 
             # -------- Mode B: Analytical Model --------
@@ -60,6 +104,8 @@ class IntegrationScreen(Screen):
             yield Button("Estimate Change in Thermal Energy (Trapezoidal Rule)", id="trap")
             yield Button("Estimate Change in Thermal Energy (Simpson's 1/3 Rule)", id="simp")
             yield Button("Show Plot", id="show_plot")
+            self.live_checkbox = Checkbox("Live preview (recompute the last method while typing)", value=True, id="live")
+            yield self.live_checkbox
             yield Label("---") 
             yield Button("Back to Main Menu", id="back")
 
@@ -70,13 +116,9 @@ class IntegrationScreen(Screen):
     # HELPERS
     # =====================================================
 
-    def _parse_cs_string(self, text: str) -> np.ndarray:
-        vals = [v.strip() for v in text.split(",") if v.strip() != ""]
-        if not vals:
-            raise ValueError("Input cannot be empty.")          
-        return np.array([float(v) for v in vals], dtype=float)
-
     def _has_points_mode(self) -> bool:
+        if self.file_input.value.strip():
+            return True
         return bool(self.x_input.value.strip()) and bool(self.y_input.value.strip())
 
     def _has_function_mode(self) -> bool:
@@ -91,18 +133,14 @@ class IntegrationScreen(Screen):
     # EVENTS
     # =====================================================
 
+    @common.profiled
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back":
             self.app.pop_screen()
             return
 
+        common.cancel_live(self)
         try:
-            points = self._has_points_mode()
-            func = self._has_function_mode()
-
-            if points and func:
-                raise ValueError("Use only ONE mode: clear either (Time and Temperature values) OR (Temperature Model f(x), Start Time, End Time, Time Step).")
-
             # If the user wants to view the plot, require a previously computed result
             if event.button.id == "show_plot":
                 if not hasattr(self, "last_plot"):
@@ -111,120 +149,137 @@ class IntegrationScreen(Screen):
 
                 if self.last_plot[0] == "points":
                     _, Xp, Yp, mname = self.last_plot
-                    integ.plot(Xp, Yp, method_name=mname)
-                    self.output.update(f"📈 Plot opened in a separate window using the {mname} method.")
+                    common.show_plot(self, integ.plot, Xp, Yp, method_name=mname, label=mname)
                     return
 
                 if self.last_plot[0] == "function":
                     _, f_np_p, a_p, b_p, h_p, mname = self.last_plot
-                    integ.plot(f_np_p, a_p, b_p, h_p, method_name=mname)
-                    self.output.update(f"📈 Plot opened in a separate window using the {mname} method.")
+                    common.show_plot(self, integ.plot, f_np_p, a_p, b_p, h_p, method_name=mname, label=mname)
                     return
 
-            if not points and not func:
-                raise ValueError("Provide either (Time and Temperature values) OR (Temperature Model f(x), Start Time, End Time, Time Step).")
+            inputs = self._read_inputs()
 
-            # -------- Mode A: Experimental Data --------
-            if points:
-                X = self._parse_cs_string(self.x_input.value)
-                Y = self._parse_cs_string(self.y_input.value)
-
-                if len(X) != len(Y):
-                    raise ValueError("Time and Temperature must have the same number of values.")
-                if len(X) < 2:
-                    raise ValueError("At least two data points are required.")
-
-                order = np.argsort(X)
-                X = X[order]
-                Y = Y[order]
-
-                if np.any(np.diff(X) <= 0):
-                    raise ValueError("Time values must be strictly increasing.")
-
-                if event.button.id == "trap":
-                    approx = integ.trapezoidal_from_points(X, Y)
-                    method = "Trapezoidal Rule (points)"
-                    utils.latest_results["method_b"] = approx
-                    utils.latest_results["description"] = "Symbolic vs Trapezoidal Rule (points)"
-                    # Store last plot args for Show Plot
-                    self.last_plot = ("points", X, Y, method)
-                    self.last_plot_name = method
-
-                else:
-                    approx = integ.simpsons_from_points(X, Y)
-                    method = "Simpson's 1/3 Rule (points)"
-                    utils.latest_results["method_b"] = approx
-                    utils.latest_results["description"] = "Symbolic vs Simpson's 1/3 Rule (points)"
-                    # Store last plot args for Show Plot
-                    self.last_plot = ("points", X, Y, method)
-                    self.last_plot_name = method
-
-
-
-                # No exact solution for arbitrary data → use trapezoid as reference
-                ref = integ.trapezoidal_from_points(X, Y)
-                err = utils.relative_error(approx, ref)
-
-                utils.latest_results["method_a"] = ref
-
-                self.output.update(
-                    f"Method: {method}\n"
-                    f"Time: {X.tolist()}\n"
-                    f"Temperature: {Y.tolist()}\n"
-                    f"---\n"
-                    f"Approx Area: {approx:.10f}\n"
-                    f"Reference (Trapezoid): {ref:.10f}\n"
-                    f"Relative Error (vs ref): {err:.4e}"
-                )
-                return
-
-            # -------- Mode B: Function --------
-            f_str = self.f_input.value.strip().replace("np.", "")
-            a = float(self.a_input.value)
-            b = float(self.b_input.value)
-            h = float(self.h_input.value)
-
-            x = sp.symbols("x")
-            f_expr = sp.sympify(f_str)
-            f_np = sp.lambdify(x, f_expr, "numpy")
-
-            N = integ.n_from_step(a, b, h)
-
-            if event.button.id == "trap":
-                approx = integ.trapezoidal_rule(f_np, a, b, N)
-                method = "Trapezoidal Rule (function)"
-                utils.latest_results["method_b"] = approx
-                utils.latest_results["description"] = "Symbolic vs Trapezoidal Rule (function)"
-                # Store last plot args for Show Plot
-                self.last_plot = ("function", f_np, a, b, h, method)
-                self.last_plot_name = method
+        except Exception as e:
+            self.output.update(self._error_text(e))
+            return
 
-            else:
-                approx = integ.simpsons_rule(f_np, a, b, N)
-                method = "Simpson's 1/3 Rule (function)"
-                utils.latest_results["method_b"] = approx
-                utils.latest_results["description"] = "Symbolic vs Simpson's 1/3 Rule (function)"
-                # Store last plot args for Show Plot
-                self.last_plot = ("function", f_np, a, b, h, method)
-                self.last_plot_name = method
+        self.output.update("⏳ Computing...")
+        common.run_compute(self, lambda: self._compute(event.button.id, inputs, record=True), self._error_text)
+
+    @staticmethod
+    def _error_text(e):
+        return f"[red]Error:[/red] {e}"
+
+    def on_input_changed(self, event):
+        if self.live_checkbox.value:
+            common.schedule_live(self, self._prepare_live)
+
+    # =====================================================
+    # COMPUTATION
+    # =====================================================
+
+    def _read_inputs(self):
+        points = self._has_points_mode()
+        func = self._has_function_mode()
 
+        if points and func:
+            raise ValueError("Use only ONE mode: clear either (Time and Temperature values) OR (Temperature Model f(x), Start Time, End Time, Time Step).")
+        if not points and not func:
+            raise ValueError("Provide either (Time and Temperature values) OR (Temperature Model f(x), Start Time, End Time, Time Step).")
 
-            exact = float(sp.N(sp.integrate(f_expr, (x, a, b))))
-            err = utils.relative_error(approx, exact)
+        if points:
+            path = self.file_input.value.strip()
+            mtime = os.path.getmtime(path) if path and os.path.isfile(path) else None
+            return ("points", self.x_input.value, self.y_input.value, path, mtime)
 
-            utils.latest_results["method_a"] = exact
+        return ("function", self.f_input.value,
+                float(self.a_input.value), float(self.b_input.value), float(self.h_input.value))
 
-            self.output.update(
-                f"Method: {method}\n"
-                f"Temperature Model = {f_expr}\n"
-                f"Time Interval: [{a}, {b}]\n"
-                f"Time Step = {h}  (N = {N})\n"
+    def _prepare_live(self):
+        """Inputs for a live preview, or None while they are incomplete."""
+        try:
+            inputs = self._read_inputs()
+        except (ValueError, OSError):
+            return None
+        method_id = getattr(self, "live_method", None)
+        if method_id is None:
+            return None  # nothing to preview until a method has been run once
+        return lambda: self._compute(method_id, inputs, record=False)
+
+    def _compute(self, method_id, inputs, record):
+        """Run one rule; parsed data, the model and the exact integral are cached."""
+        rule, rule_from_points, name, key = METHODS[method_id]
+        suffix = "" if record else " (live preview)"
+
+        # -------- Mode A: Experimental Data --------
+        if inputs[0] == "points":
+            X, Y = _points(*inputs[1:])
+            if common.cancelled():
+                return None
+
+            method = f"{name} (points)"
+            with instrumentation.collect(method_id) as metrics:
+                approx = rule_from_points(X, Y)
+            runtime = metrics.seconds
+
+            # No exact solution for arbitrary data → use trapezoid as reference
+            ref = integ.trapezoidal_from_points(X, Y)
+            err = utils.relative_error(approx, ref)
+
+            def apply():
+                # Store last plot args for Show Plot (and the method for the live preview)
+                self.last_plot = ("points", X, Y, method)
+                self.last_plot_name = method
+                self.live_method = method_id
+                if record:
+                    self.app.history.record(f"{key}_points", ref, approx, n=len(X) - 1, runtime=runtime)
+
+            return (
+                f"Method: {method}{suffix}\n"
+                f"Time: {dataio.summarize(X)}\n"
+                f"Temperature: {dataio.summarize(Y)}\n"
                 f"---\n"
                 f"Approx Area: {approx:.10f}\n"
-                f"Exact Area: {exact:.10f}\n"
-                f"Relative Error: {err:.4e}"
-            )
-            return
+                f"Reference (Trapezoid): {ref:.10f}\n"
+                f"Relative Error (vs ref): {err:.4e}\n"
+                f"---\n"
+                f"{metrics.summary()}"
+            ), apply
+
+        # -------- Mode B: Function --------
+        _, f_str, a, b, h = inputs
+        f_expr, f_np = common.parse_model(f_str)
+        N = integ.n_from_step(a, b, h)
+
+        method = f"{name} (function)"
+        with instrumentation.collect(method_id) as metrics:
+            approx = rule(f_np, a, b, N)
+        runtime = metrics.seconds
+        if common.cancelled():
+            return None
+
+        exact = _exact_integral(f_expr, a, b)
+        if common.cancelled():
+            return None
+        err = utils.relative_error(approx, exact)
+
+        def apply():
+            # Store last plot args for Show Plot (and the method for the live preview)
+            self.last_plot = ("function", f_np, a, b, h, method)
+            self.last_plot_name = method
+            self.live_method = method_id
+            if record:
+                self.app.history.record(key, exact, approx, h=h, n=N, runtime=runtime)
 
-        except Exception as e:
-            self.output.update(f"[red]Error:[/red] {e}")
+        return (
+            f"Method: {method}{suffix}\n"
+            f"Temperature Model = {f_expr}\n"
+            f"Time Interval: [{a}, {b}]\n"
+            f"Time Step = {h}  (N = {N})\n"
+            f"---\n"
+            f"Approx Area: {approx:.10f}\n"
+            f"Exact Area: {exact:.10f}\n"
+            f"Relative Error: {err:.4e}\n"
+            f"---\n"
+            f"{metrics.summary()}"
+        ), apply
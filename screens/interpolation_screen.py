@@ -1,10 +1,47 @@
 from textual.screen import Screen
-from textual.widgets import Label, Input, Button, Static
+from textual.widgets import Label, Input, Button, Static, Checkbox
 from textual.containers import VerticalScroll
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+
+import compute
+import cooling
+import dataio
 import interpolation as interp 
+import instrumentation
+import common
+
+
+@lru_cache(maxsize=8)
+def _points(x_text, y_text, path, mtime):
+    """Parsed and validated data points; reused until an input (or the file) changes."""
+    if path:
+        X, Y = dataio.load_columns(path)
+    else:
+        X = dataio.parse_values(x_text)
+        Y = dataio.parse_values(y_text)
+
+    # Error checking for data points
+    if len(X) != len(Y):
+        raise ValueError("Time and Temperature data points must have the same length.")
+    if len(X) < 2:
+        raise ValueError("At least two data points are required.")
+    if len(np.unique(X)) != len(X):
+        raise ValueError("Time values must be distinct.")
+
+    return X, Y
+
+
+@lru_cache(maxsize=8)
+def _newton_coefficients(*data_key):
+    """Divided-difference coefficients of the data: a new evaluation time reuses them."""
+    X, Y = _points(*data_key)
+    return compute.call(interp.divided_differences, X, Y)
+
 
 class InterpolationScreen(Screen):
     CSS_PATH = str(Path(__file__).parent / "static_and_label.tcss")
@@ -30,18 +67,23 @@ class InterpolationScreen(Screen):
             # Inputs for the known data points (X and Y)
             self.x_data_input = Input(placeholder="Time data (s) (comma-separated, e.g., 1, 2, 3)")
             self.y_data_input = Input(placeholder="Temperature data (°C) (comma-separated, e.g., 0, 1, 0)")
+            self.file_input = Input(placeholder="...or data file (CSV/NPY/NPZ) with time and temperature columns")
             
             # New input for the single point to evaluate (x)
             self.x_eval_input = Input(placeholder="Time value to evaluate at (e.g., 1.5)")
             
             yield self.x_data_input
             yield self.y_data_input 
+            yield self.file_input
             yield self.x_eval_input
             
 
             yield Button("Estimate/Predict Temperature Using Divided Differences Method", id="compute_divided")
             yield Button("Estimate/Predict Temperature Using Lagrange Method", id="compute_lagrange")
+            yield Button("Estimate Cooling Constant k and Ambient Temperature", id="compute_cooling")
             yield Button("Show Plot", id="show_plot")
+            self.live_checkbox = Checkbox("Live preview (recompute the last method while typing)", value=True, id="live")
+            yield self.live_checkbox
 
             yield Label("---") 
             yield Button("Back to Main Menu", id="back_to_main")
@@ -50,57 +92,15 @@ class InterpolationScreen(Screen):
             yield self.output
 
 
+    @common.profiled
     def on_button_pressed(self, event):
         if event.button.id == "back_to_main":
             self.app.pop_screen()
             return
         
+        common.cancel_live(self)
         try:
-            # Parse the data points X and Y
-            X = list(map(float, self.x_data_input.value.split(",")))
-            Y = list(map(float, self.y_data_input.value.split(",")))
-
-            # Error checking for data points
-            if len(X) != len(Y):
-                raise ValueError("Time and Temperature data points must have the same length.")
-            if len(X) < 2:
-                raise ValueError("At least two data points are required.")
-            if len(set(X)) != len(X):
-                raise ValueError("Time values must be distinct.")
-
-            # Parse the single evaluation point x
-            x_eval = float(self.x_eval_input.value)
-            result_value = 0
-            method_name = ""
-            degree = len(X) - 1
-
-
-            if x_eval < min(X) or x_eval > max(X):
-                mode = "Extrapolation"
-            else:
-                mode = "Interpolation"
-
-            if event.button.id == "compute_divided":
-                result_value = interp.newton_interpolation(x_eval, X, Y)
-                method_name = "Divided Differences"
-                # Store the last used method for plotting
-                self.last_method = interp.newton_interpolation 
-                self.last_method_name = method_name
-
-            elif event.button.id == "compute_lagrange":
-                result_value = interp.lagrange_interpolation(x_eval, X, Y)
-                method_name = "Lagrange"
-                # Store the last used method for plotting
-                self.last_method = interp.lagrange_interpolation
-                self.last_method_name = method_name
-
-            # Determine Heating or Cooling state
-            state = "Stable"
-
-            if (result_value > 0):
-                state = "Heating"
-            elif (result_value < 0):
-                state = "Cooling"
+            data_key = self._data_key()
 
             # Show plot if requested
             if event.button.id == "show_plot":
@@ -110,26 +110,132 @@ class InterpolationScreen(Screen):
                      return # Exit function before formatting block
 
                 # Use the last computed method for plotting
-                interp.plot(X, Y, self.last_method)
-                self.output.update(f"📈 Plot opened in a separate window using the {self.last_method_name} method.")
+                X, Y = _points(*data_key)
+                common.show_plot(self, interp.plot, X, Y, self.last_method, label=self.last_method_name)
                 return
 
-            # Update Output 
-            output_text = (
-                f"Method: {method_name}\n"
-                f"Operation: {mode}\n"
-                f"Polynomial degree: {degree}\n"
-                f"Time data points: {X}\n"
-                f"Temperature data points: {Y}\n"
-                f"Interpolated/Extrapolated value at time: {x_eval}\n"
-                f"Result: {result_value:0.6f}"
-                f"\nThe body is currently {state}"
-            )
-            self.output.update(output_text)
-
-        except ValueError:
-            self.output.update("❌  **Error:** Please ensure all inputs are valid numbers separated by commas (or a single number for evaluated time).")
-        except IndexError:
-            self.output.update("❌  **Error:** Please ensure you have entered an equal number of time and temperature data points.")
-        except ZeroDivisionError:
-            self.output.update("❌  **Error:** Time data points must be unique. The current data points will cause division by zero.")
\ No newline at end of file
+            # Newton's Law of Cooling fit needs no evaluation time
+            x_eval = None if event.button.id == "compute_cooling" else float(self.x_eval_input.value)
+
+        except Exception as e:
+            self.output.update(self._error_text(e))
+            return
+
+        self.output.update("⏳ Computing...")
+        common.run_compute(self, lambda: self._compute(event.button.id, data_key, x_eval, live=False), self._error_text)
+
+    @staticmethod
+    def _error_text(e):
+        if isinstance(e, OSError):
+            return f"❌  **Error:** Could not read the data file: {e}"
+        if isinstance(e, ValueError):
+            return f"❌  **Error:** Invalid input (numbers separated by commas, or a single number for the evaluated time).\nDetails: {e}"
+        if isinstance(e, IndexError):
+            return "❌  **Error:** Please ensure you have entered an equal number of time and temperature data points."
+        if isinstance(e, ZeroDivisionError):
+            return "❌  **Error:** Time data points must be unique. The current data points will cause division by zero."
+        return f"❌  **Error:** {e}"
+
+    def on_input_changed(self, event):
+        if self.live_checkbox.value:
+            common.schedule_live(self, self._prepare_live)
+
+    # =====================================================
+    # COMPUTATION
+    # =====================================================
+
+    def _data_key(self):
+        """Cache key of the data inputs (the file's modification time catches edits)."""
+        path = self.file_input.value.strip()
+        mtime = os.path.getmtime(path) if path and os.path.isfile(path) else None
+        return (self.x_data_input.value, self.y_data_input.value, path, mtime)
+
+    def _prepare_live(self):
+        """Inputs for a live preview, or None while they are incomplete."""
+        method_id = getattr(self, "live_method", None)
+        if method_id is None:
+            return None  # nothing to preview until a method has been run once
+        try:
+            data_key = self._data_key()
+            x_eval = None if method_id == "compute_cooling" else float(self.x_eval_input.value)
+        except (ValueError, OSError):
+            return None
+        return lambda: self._compute(method_id, data_key, x_eval, live=True)
+
+    def _compute(self, method_id, data_key, x_eval, live):
+        """Run one method; parsed data and Newton coefficients are cached per data input."""
+        suffix = " (live preview)" if live else ""
+        X, Y = _points(*data_key)
+        if common.cancelled():
+            return None
+
+        def apply():
+            self.live_method = method_id
+
+        if method_id == "compute_cooling":
+            order = np.argsort(X)
+            with instrumentation.collect(method_id) as metrics:
+                estimator = cooling.estimate(X[order], Y[order])
+            return (
+                f"Method: Newton's Law of Cooling fit (dT/dt = -k (T - Tₐ)){suffix}\n"
+                f"Time data points: {dataio.summarize(X)}\n"
+                f"Temperature data points: {dataio.summarize(Y)}\n"
+                f"{estimator.summary()}\n"
+                f"---\n"
+                f"{metrics.summary()}"
+            ), apply
+
+        degree = len(X) - 1
+        if x_eval < X.min() or x_eval > X.max():
+            mode = "Extrapolation"
+        else:
+            mode = "Interpolation"
+
+        with instrumentation.collect(method_id) as metrics:
+            if method_id == "compute_divided":
+                result_value = interp.newton_evaluate(x_eval, X, _newton_coefficients(*data_key))
+                method = interp.newton_interpolation
+                method_name = "Divided Differences"
+
+            else:
+                result_value = compute.call(interp.lagrange_interpolation, x_eval, X, Y)
+                method = interp.lagrange_interpolation
+                method_name = "Lagrange"
+        runtime = metrics.seconds
+
+        if not live:
+            # No exact value exists: the other formulation of the same polynomial is the
+            # reference, so the recorded error is the round-off of this one
+            if method_id == "compute_divided":
+                key, reference = "newton", compute.call(interp.lagrange_interpolation, x_eval, X, Y)
+            else:
+                key, reference = "lagrange", interp.newton_evaluate(x_eval, X, _newton_coefficients(*data_key))
+
+        def apply():
+            # Store the last used method for plotting (and for the live preview)
+            self.last_method = method
+            self.last_method_name = method_name
+            self.live_method = method_id
+            if not live:
+                self.app.history.record(key, reference, result_value, n=degree, runtime=runtime)
+
+        # Determine Heating or Cooling state
+        state = "Stable"
+
+        if (result_value > 0):
+            state = "Heating"
+        elif (result_value < 0):
+            state = "Cooling"
+
+        return (
+            f"Method: {method_name}{suffix}\n"
+            f"Operation: {mode}\n"
+            f"Polynomial degree: {degree}\n"
+            f"Time data points: {dataio.summarize(X)}\n"
+            f"Temperature data points: {dataio.summarize(Y)}\n"
+            f"Interpolated/Extrapolated value at time: {x_eval}\n"
+            f"Result: {result_value:0.6f}"
+            f"\nThe body is currently {state}\n"
+            f"---\n"
+            f"{metrics.summary()}"
+        ), apply
@@ -2,18 +2,28 @@
 from textual.widgets import Static, Label, Button, Input
 from textual.containers import VerticalScroll
 from pathlib import Path
+import argparse
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import profiling
+import utils
 import interpolation_screen as interp_screen
 import differentiation_screen as diff_screen
 import integration_screen as integ_screen
 import error_screen as error_screen
+import profile_screen
 
 
 class TextualApp(App):
     CSS_PATH = str(Path(__file__).parent / "static_and_label.tcss")
 
+    def __init__(self):
+        super().__init__()
+        # Results shared by the computation screens and the Error Analysis screen;
+        # kept on the app so every session (see serve.py) has its own
+        self.history = utils.ResultsHistory()
+
     def compose(self):
 
         # VerticalScroll guarantees scrolling
@@ -36,6 +46,8 @@ class TextualApp(App):
             yield Button("3. Estimate Cooling / Heating Rate (Numerical Differentiation)", id="diff-btn")
             yield Button("4. Estimate Thermal Energy Change (Numerical Integration)", id="integ-btn")
             yield Button("5. Thermal Model Accuracy (Error Analysis)", id="error-btn")
+            if profiling.config["enabled"]:
+                yield Button("Profiling Results (hot functions, latencies)", id="profile-btn")
             yield Button("0. Exit", id="exit-btn")
 
             # Status display
@@ -77,6 +89,8 @@ class TextualApp(App):
                 self.push_screen(integ_screen.IntegrationScreen())
             case "error-btn":
                 self.push_screen(error_screen.ErrorScreen())
+            case "profile-btn":
+                self.push_screen(profile_screen.ProfileScreen())
     
     # --- Input submission (press Enter) ---
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -122,5 +136,11 @@ class TextualApp(App):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Thermal simulation TUI.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile every button action (see the Profiling Results screen)")
+    if parser.parse_args().profile:
+        profiling.enable()
+
     app = TextualApp()
     app.run()
@@ -0,0 +1,119 @@
+from textual.screen import Screen
+from textual.widgets import Label, Button, Static
+from textual.containers import VerticalScroll
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import profiling
+
+
+def _duration(seconds):
+    if seconds == float("inf"):
+        return "∞"
+    if seconds < 1:
+        return f"{seconds * 1e3:g} ms"
+    return f"{seconds:g} s"
+
+
+class ProfileScreen(Screen):
+    CSS_PATH = str(Path(__file__).parent / "static_and_label.tcss")
+    """Hot functions and per-action latencies gathered with --profile."""
+
+    def compose(self):
+
+        with VerticalScroll(id="menu-container"):
+
+            yield Label("Profiling Results", id="title")
+            yield Static(
+                "Every button press is one action, profiled with cProfile.\n"
+                "Latency runs from the press until its result (or plot) is shown.",
+                classes="status",
+            )
+
+            yield Label("Action Latency")
+            self.latency_output = Static("", id="latency_output", markup=False)
+            yield self.latency_output
+
+            yield Label("Hot Functions (own time, all actions)")
+            self.hot_output = Static("", id="hot_output", markup=False)
+            yield self.hot_output
+
+            yield Button("Refresh", id="refresh_profile")
+            yield Button("Export Profiles (.prof)", id="export_profile")
+            yield Button("Reset", id="reset_profile")
+
+            yield Label("---")
+            yield Button("Back to Main Menu", id="back_to_main")
+
+    def on_mount(self):
+        self.refresh_report()
+
+    def on_screen_resume(self):
+        self.refresh_report()
+
+    def refresh_report(self):
+        if not profiling.config["enabled"]:
+            self.latency_output.update("Profiling is off. Start the app with --profile (or THERMAL_SIM_PROFILE=1).")
+            self.hot_output.update("")
+            return
+        self.latency_output.update(self._format_latencies())
+        self.hot_output.update(self._format_hot_functions())
+
+    def _format_latencies(self):
+        actions = profiling.actions()
+        if not actions:
+            return "No actions recorded yet. Press some buttons on the other screens."
+
+        lines = []
+        for label, stats in sorted(actions.items(), key=lambda item: item[1]["mean"], reverse=True):
+            lines.append(
+                f"{label}: {stats['count']} run(s), mean {stats['mean'] * 1e3:.1f} ms, "
+                f"p50 {stats['p50'] * 1e3:.1f} ms, p90 {stats['p90'] * 1e3:.1f} ms, max {stats['max'] * 1e3:.1f} ms"
+            )
+            if stats["unprofiled"]:
+                lines.append(f"  ⚠️  {stats['unprofiled']} run(s) not profiled (another profiler was active)")
+            bins = profiling.histogram(label)
+            used = [i for i, (_, _, count) in enumerate(bins) if count]
+            peak = max(count for _, _, count in bins)
+            for low, high, count in bins[used[0]:used[-1] + 1]:
+                bar = "█" * round(20 * count / peak)
+                lines.append(f"  {_duration(low):>7} … {_duration(high):<7} {bar} {count}")
+            lines.append("")
+        return "\n".join(lines).rstrip()
+
+    def _format_hot_functions(self):
+        rows = profiling.hot_functions(top=15)
+        if not rows:
+            return "No profiles recorded yet."
+
+        breakdown = profiling.breakdown()
+        total = sum(breakdown.values()) or 1.0
+        lines = ["Own time by library: " + ", ".join(
+            f"{library} {seconds / total:.0%}" for library, seconds in breakdown.items() if seconds / total >= 0.005
+        ), ""]
+        lines.append(f"{'own ms':>9} {'cum ms':>9} {'calls':>8}  function")
+        for row in rows:
+            lines.append(
+                f"{row['own'] * 1e3:9.1f} {row['cumulative'] * 1e3:9.1f} {row['calls']:8d}  "
+                f"{row['function']} [{row['library']}]"
+            )
+        return "\n".join(lines)
+
+    def on_button_pressed(self, event):
+        if event.button.id == "back_to_main":
+            self.app.pop_screen()
+        elif event.button.id == "refresh_profile":
+            self.refresh_report()
+        elif event.button.id == "reset_profile":
+            profiling.reset()
+            self.refresh_report()
+        elif event.button.id == "export_profile":
+            paths = profiling.export()
+            if not paths:
+                self.hot_output.update("⚠️  Nothing to export yet.")
+                return
+            self.hot_output.update(
+                self._format_hot_functions()
+                + f"\n\n💾 {len(paths)} profile(s) exported to {paths[0].parent.resolve()}"
+                + f"\nOpen with e.g. `snakeviz {paths[0]}` or `python -m pstats {paths[0]}`."
+            )
@@ -0,0 +1,64 @@
+"""Serve the app in the browser to several users at once (textual-serve).
+
+Every browser session gets its own app process, so inputs, results and the Error
+Analysis history are never shared between users. Heavy symbolic and numeric work
+(exact integrals, divided differences, Lagrange evaluation) from all sessions runs
+in one shared, size-limited process pool with fair per-session queues (see
+compute.py), so the server's CPU use stays bounded however many users connect.
+
+Usage (run from project root; requires `pip install textual-serve`):
+
+    python serve.py --host 0.0.0.0 --port 8000 --workers 4 --queue-limit 16
+
+Plots are saved as image files on the server (./plots by default).
+"""
+import argparse
+import os
+import secrets
+import sys
+from pathlib import Path
+
+import compute
+
+ROOT = Path(__file__).resolve().parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the thermal simulation app to web browsers.")
+    parser.add_argument("--host", default="localhost", help="Interface to listen on (0.0.0.0 for all)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--public-url", help="Public URL when behind a proxy")
+    parser.add_argument("--workers", type=int, default=None, help="Compute pool processes (default: CPU count)")
+    parser.add_argument("--queue-limit", type=int, default=16, help="Maximum pending computations per session")
+    args = parser.parse_args()
+
+    try:
+        from textual_serve.server import Server
+    except ImportError:
+        print("Served mode requires the 'textual-serve' package (pip install textual-serve)", file=sys.stderr)
+        return 1
+
+    pool = compute.ComputePool(args.workers, args.queue_limit)
+    authkey = secrets.token_hex(16)
+    listener = compute.serve(pool, authkey=authkey.encode())
+    host, port = listener.address
+
+    # Session processes inherit these: they send heavy work to the pool and save plots to files
+    os.environ["THERMAL_SIM_COMPUTE_ADDRESS"] = f"{host}:{port}"
+    os.environ["THERMAL_SIM_COMPUTE_KEY"] = authkey
+    os.environ.setdefault("THERMAL_SIM_PLOT_BACKEND", "file")
+
+    print(f"Compute pool: {pool.workers} worker(s), {args.queue_limit} pending job(s) per session")
+    command = f'"{sys.executable}" "{ROOT / "screens" / "main.py"}"'
+    server = Server(command, host=args.host, port=args.port, title="Thermal Simulation",
+                    public_url=args.public_url)
+    try:
+        server.serve()
+    finally:
+        listener.close()
+        pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import json
+
+import batch
+
+
+def test_csv_bad_value_fails_only_its_row(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "id,method,x,y,at\n"
+        "r1,newton,0;1;2,0;1;4,1.5\n"
+        "r2,newton,0;1;2,0;abc;4,1.5\n"
+        ",lagrange,0;1;2,0;1;4,1.5\n"
+    )
+    jobs = list(batch.read_jobs(path))
+
+    assert [job["id"] for job in jobs] == ["r1", "r2", 2]
+    assert "_parse_error" in jobs[1]
+    records = [batch._run_or_report(job) for job in jobs]
+    assert [r["ok"] for r in records] == [True, False, True]
+    assert "abc" in records[1]["error"]
+    assert records[0]["result"] == records[2]["result"] == 2.25
+
+
+def test_csv_row_with_extra_cells_fails_only_its_row(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "id,method,x,y,at\n"
+        "r1,newton,0;1;2,0;1;4,1.5\n"
+        "r2,newton,0;1;2,0;1;4,1.5,extra\n"
+    )
+    output = tmp_path / "out.jsonl"
+
+    assert batch.main([str(path), "-o", str(output), "--workers", "1"]) == 1
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [(r["id"], r["ok"]) for r in records] == [("r1", True), ("r2", False)]
+    assert "more cell(s) than the header" in records[1]["error"]
+
+
+def test_jsonl_malformed_line_is_isolated_and_blank_lines_do_not_shift_ids(tmp_path):
+    job = json.dumps({"method": "newton", "x": [0, 1], "y": [0, 1], "at": 0.5})
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(f"\n{job}\n\n{{bad\n[1, 2]\n{job}\n")
+    jobs = list(batch.read_jobs(path))
+
+    assert [job["id"] for job in jobs] == [0, 1, 2, 3]
+    assert [("_parse_error" in job) for job in jobs] == [False, True, True, False]
+    records = [batch._run_or_report(job) for job in jobs]
+    assert [r["ok"] for r in records] == [True, False, False, True]
+
+
+def test_unknown_method_is_a_failed_record():
+    record = batch.run_job({"id": "x", "method": "nope"})
+    assert record["ok"] is False
+    assert "Unknown method" in record["error"]
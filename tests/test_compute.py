@@ -0,0 +1,94 @@
+import os
+import time
+from concurrent.futures import CancelledError, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import compute
+
+
+@pytest.fixture
+def pool():
+    pool = compute.ComputePool(workers=1, queue_limit=3)
+    yield pool
+    pool.shutdown()
+
+
+def test_sessions_are_served_round_robin(pool):
+    done = []
+    pool.submit("busy", time.sleep, 0.3)  # occupies the only worker while the queues fill
+    futures = [pool.submit("a", abs, -1), pool.submit("a", abs, -2), pool.submit("a", abs, -3),
+               pool.submit("b", abs, -10)]
+    for future in futures:
+        future.add_done_callback(lambda f: done.append(f.result()))
+
+    assert [f.result(timeout=30) for f in futures] == [1, 2, 3, 10]
+    assert done == [1, 10, 2, 3]
+
+
+def test_queue_limit_rejects_extra_jobs(pool):
+    pool.submit("a", time.sleep, 0.3)
+    queued = [pool.submit("a", abs, -i) for i in range(3)]
+    rejected = pool.submit("a", abs, -4)
+
+    with pytest.raises(RuntimeError, match="limit 3"):
+        rejected.result(timeout=1)
+    assert pool.submit("b", abs, -5).result(timeout=30) == 5  # other sessions are unaffected
+    assert [f.result(timeout=30) for f in queued] == [0, 1, 2]
+
+
+def test_invalid_queue_limit():
+    with pytest.raises(ValueError):
+        compute.ComputePool(workers=1, queue_limit=0)
+
+
+def test_shutdown_fails_queued_jobs(pool):
+    running = pool.submit("a", time.sleep, 0.3)
+    queued = pool.submit("a", abs, -1)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError, match="shut down"):
+        queued.result(timeout=1)
+    assert running.result(timeout=30) is None
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.submit("a", abs, -1).result(timeout=1)
+
+
+def test_cancelled_job_fails_its_future(pool):
+    outer, inner = Future(), Future()
+    outer.set_running_or_notify_cancel()
+    inner.cancel()
+    pool._running = 1
+
+    pool._finished(outer, inner)  # must not raise CancelledError
+    assert isinstance(outer.exception(timeout=0), CancelledError)
+
+
+def test_pool_recovers_after_a_worker_dies(pool):
+    crashed = pool.submit("a", os._exit, 1)
+    with pytest.raises(BrokenProcessPool):
+        crashed.result(timeout=30)
+
+    assert pool.submit("b", abs, -3).result(timeout=30) == 3
+
+
+def test_client_round_trip(pool):
+    listener = compute.serve(pool, authkey=b"secret")
+    host, port = listener.address
+    client = compute.Client(f"{host}:{port}", "secret", session="s1")
+    try:
+        assert client.call(divmod, 7, 2) == (3, 1)
+        with pytest.raises(ValueError):
+            client.call(int, "not a number")
+        assert client.call(abs, -2) == 2  # the connection survives a failed job
+    finally:
+        client.close()
+        listener.close()
+
+
+def test_call_runs_in_process_when_not_served(monkeypatch):
+    monkeypatch.setitem(compute.config, "address", None)
+    marker = []
+    assert compute.call(marker.append, 1) is None
+    assert marker == [1]
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import convergence
+import differentiation as diff
+import integration as integ
+
+
+def test_central_difference_is_second_order():
+    steps = convergence.step_sizes(0.5, 2.0, 8)
+    study = convergence.differentiation_study(np.sin, 1.0, np.cos(1.0), diff.central_difference, steps)
+
+    assert study["order"] == pytest.approx(2.0, abs=0.05)
+    assert study["roundoff_index"] is None
+
+
+def test_analyze_fits_the_order_of_synthetic_errors():
+    steps = 0.1 / 2.0 ** np.arange(6)
+    study = convergence._analyze(steps, 1.0 + 3.0 * steps ** 2, 1.0)
+
+    assert study["order"] == pytest.approx(2.0)
+    np.testing.assert_allclose(study["local_order"], 2.0)
+
+
+def test_simpson_study_is_fourth_order():
+    study = convergence.integration_study(np.exp, 0.0, 1.0, np.e - 1.0, integ.simpsons_rule, 0.25, 6)
+
+    assert study["order"] == pytest.approx(4.0, abs=0.1)
+    assert study["evaluations"] == 4 * 2 ** 5 + 1
+
+
+@pytest.mark.parametrize("count", [1, convergence.MAX_COUNT + 1, 100])
+def test_step_count_is_limited(count):
+    with pytest.raises(ValueError):
+        convergence.step_sizes(0.5, 2.0, count)
+    with pytest.raises(ValueError):
+        convergence.integration_study(np.exp, 0.0, 1.0, np.e - 1.0, integ.trapezoidal_rule, 0.5, count)
+
+
+def test_integration_study_rejects_grids_above_the_sample_limit():
+    with pytest.raises(ValueError, match="samples"):
+        convergence.integration_study(np.exp, 0.0, 1.0, np.e - 1.0, integ.trapezoidal_rule, 0.5, 30)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import cooling
+import simulation
+
+
+@pytest.fixture
+def curve():
+    t = np.linspace(0.0, 300.0, 601)
+    T = 20.0 + 70.0 * np.exp(-0.02 * t)
+    return t, T
+
+
+def test_exact_curve_recovers_k_and_ambient(curve):
+    est = cooling.estimate(*curve)
+    assert est.k == pytest.approx(0.02, rel=1e-3)
+    assert est.ambient == pytest.approx(20.0, abs=0.05)
+    assert est.r_squared > 0.999
+
+
+@pytest.mark.parametrize("forgetting", [1.0, 0.99])
+def test_update_and_update_many_agree(curve, forgetting):
+    t, T = curve
+    T = T + np.random.default_rng(0).normal(0.0, 0.05, len(T))
+
+    one_by_one = cooling.CoolingEstimator(forgetting)
+    for ti, Ti in zip(t, T):
+        one_by_one.update(ti, Ti)
+
+    chunked = cooling.CoolingEstimator(forgetting)
+    for start in range(0, len(t), 97):  # uneven chunks, split intervals between them
+        chunked.update_many(t[start:start + 97], T[start:start + 97])
+
+    assert chunked.samples == one_by_one.samples
+    assert chunked.k == pytest.approx(one_by_one.k, rel=1e-9)
+    assert chunked.ambient == pytest.approx(one_by_one.ambient, rel=1e-9)
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_rejected_sample_leaves_the_estimate_unchanged(chunked):
+    good = [(0.0, 90.0), (1.0, 80.0), (2.0, 72.0), (3.0, 65.0)]
+    expected = cooling.estimate(*zip(*good))
+
+    est = cooling.CoolingEstimator()
+    for t, T in good[:3]:
+        est.update(t, T)
+    with pytest.raises(ValueError):
+        if chunked:
+            est.update_many([1.5], [75.0])
+        else:
+            est.update(1.5, 75.0)
+    est.update(*good[3])
+
+    assert est.samples == 4
+    assert est.k == pytest.approx(expected.k, rel=1e-12)
+    assert est.ambient == pytest.approx(expected.ambient, rel=1e-12)
+
+
+def test_estimate_file_streams_chunks(tmp_path):
+    t = np.linspace(0.0, 600.0, 1201)
+    sim = simulation.simulate(0.01, 20.0, 90.0, t, method="rk4", out=str(tmp_path / "run.npy"))
+
+    est = cooling.estimate_file(tmp_path / "run.npy", chunk_rows=100)
+    assert est.k == pytest.approx(0.01, rel=1e-3)
+    assert est.ambient == pytest.approx(20.0, abs=0.1)
+    assert est.samples == len(sim["t"])
+
+
+def test_forgetting_must_be_in_range():
+    with pytest.raises(ValueError):
+        cooling.CoolingEstimator(0.0)
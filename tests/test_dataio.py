@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import dataio
+
+
+def test_parse_values_accepts_commas_and_whitespace():
+    np.testing.assert_array_equal(dataio.parse_values("1, 2.5,3"), [1.0, 2.5, 3.0])
+    np.testing.assert_array_equal(dataio.parse_values("1 2\t3"), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(dataio.parse_values("1,,2,"), [1.0, 2.0])
+
+
+def test_parse_values_names_the_bad_token():
+    with pytest.raises(ValueError, match="'abc'"):
+        dataio.parse_values("1, abc, 3")
+    with pytest.raises(ValueError):
+        dataio.parse_values("  ")
+
+
+def test_csv_with_header_is_read_in_chunks(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("time,temp\n" + "".join(f"{i},{100 - i}\n" for i in range(25)))
+
+    chunks = list(dataio.iter_columns(path, chunk_rows=10))
+    assert [len(t) for t, _ in chunks] == [10, 10, 5]
+
+    t, T = dataio.load_columns(path, chunk_rows=10)
+    np.testing.assert_array_equal(t, np.arange(25.0))
+    np.testing.assert_array_equal(T, 100.0 - np.arange(25.0))
+
+
+@pytest.mark.parametrize("layout", ["columns", "rows"])
+def test_npy_columns_or_rows(tmp_path, layout):
+    data = np.stack([np.arange(5.0), np.arange(5.0) ** 2], axis=1)
+    path = tmp_path / "log.npy"
+    np.save(path, data if layout == "columns" else data.T)
+
+    t, T = dataio.load_columns(path)
+    np.testing.assert_array_equal(t, data[:, 0])
+    np.testing.assert_array_equal(T, data[:, 1])
+
+
+@pytest.mark.parametrize("shape", [(5, 1), (1, 5), (5,)])
+def test_npy_with_a_single_column_names_the_expected_layout(tmp_path, shape):
+    path = tmp_path / "bad.npy"
+    np.save(path, np.ones(shape))
+    with pytest.raises(ValueError, match=r"\(n, 2\)"):
+        dataio.load_columns(path)
+
+
+def test_npz_by_name(tmp_path):
+    path = tmp_path / "log.npz"
+    np.savez(path, T=np.array([3.0, 2.0]), t=np.array([0.0, 1.0]))
+    t, T = dataio.load_columns(path)
+    np.testing.assert_array_equal(t, [0.0, 1.0])
+    np.testing.assert_array_equal(T, [3.0, 2.0])
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        dataio.load_columns(tmp_path / "nope.csv")
+
+
+def test_summarize_shortens_large_arrays():
+    assert dataio.summarize(np.array([1.0, 2.0])) == "[1.0, 2.0]"
+    assert len(dataio.summarize(np.arange(10_000.0))) < 200
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import downsampling
+import interpolation as interp
+import plotting
+
+
+@pytest.fixture
+def series():
+    x = np.linspace(0.0, 100.0, 100_000)
+    y = np.sin(x) + 0.01 * x
+    y[12_345] = 50.0  # a spike that must survive
+    return x, y
+
+
+def test_small_series_are_returned_unchanged():
+    x, y = np.arange(10.0), np.arange(10.0) ** 2
+    xd, yd = downsampling.downsample(x, y, max_points=100)
+    np.testing.assert_array_equal(xd, x)
+    np.testing.assert_array_equal(yd, y)
+
+
+@pytest.mark.parametrize("method", downsampling.METHODS)
+def test_output_is_bounded_sorted_and_keeps_the_ends(series, method):
+    x, y = series
+    xd, yd = downsampling.downsample(x, y, max_points=1000, method=method)
+
+    assert 3 <= len(xd) <= 1000
+    assert np.all(np.diff(xd) > 0)
+    assert (xd[0], xd[-1]) == (x[0], x[-1])
+
+
+def test_minmax_keeps_extremes(series):
+    x, y = series
+    _, yd = downsampling.downsample(x, y, max_points=1000, method="minmax")
+    assert yd.max() == y.max()
+    assert yd.min() == y.min()
+
+
+def test_lttb_returns_exactly_n_out_points(series):
+    x, y = series
+    idx = downsampling.lttb_indices(x, y, 500)
+    assert len(idx) == 500
+    assert 12_345 in idx
+
+
+def test_unknown_method_is_rejected(series):
+    with pytest.raises(ValueError):
+        downsampling.downsample(*series, max_points=10, method="nope")
+
+
+def test_label_reports_the_original_count():
+    assert downsampling.label("Data", 10_000, 500) == "Data (500 of 10,000 points shown)"
+    assert downsampling.label("Data", 50, 50) == "Data (50 points)"
+
+
+def test_interpolation_plot_downsamples_unsorted_nodes(tmp_path, monkeypatch):
+    monkeypatch.setitem(plotting.config, "backend", "file")
+    monkeypatch.setitem(plotting.config, "output_dir", str(tmp_path))
+    monkeypatch.setitem(downsampling.config, "max_points", 4)
+    X = np.array([3.0, 0.0, 5.0, 2.0, 4.0, 1.0])
+
+    path = interp.plot(X, X ** 2, interp.lagrange_interpolation)
+    assert Path(path).is_file()
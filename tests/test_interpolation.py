@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+import interpolation as interp
+
+
+def test_newton_and_lagrange_agree_and_reproduce_a_polynomial():
+    X = np.array([0.0, 1.0, 3.0, 4.0])
+    Y = X ** 3 - 2 * X
+
+    for x in (0.5, 2.0, 5.0):
+        assert interp.newton_interpolation(x, X, Y) == pytest.approx(x ** 3 - 2 * x)
+        assert interp.lagrange_interpolation(x, X, Y) == pytest.approx(x ** 3 - 2 * x)
+
+
+def test_too_many_points_are_rejected_before_allocating():
+    X = np.arange(interp.MAX_POINTS + 1.0)
+    with pytest.raises(ValueError, match="at most"):
+        interp.divided_differences(X, X)
+    with pytest.raises(ValueError, match="at most"):
+        interp.lagrange_interpolation(0.5, X, X)
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+import memo
+
+
+class Counter:
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+
+def test_repeated_inputs_hit_the_cache():
+    f = Counter(np.sin)
+    m = memo.MemoizedFunction(f)
+    x = np.linspace(0.0, 1.0, 11)
+
+    first = m(x)
+    np.testing.assert_array_equal(m(x.copy()), first)
+    assert m(0.5) == m(0.5)
+    assert f.calls == 2
+    assert m.info()["hits"] == 2
+
+
+@pytest.mark.parametrize("a, b", [
+    (0.0, -0.0),                                           # equal floats, different bits
+    (0.1 + 0.2, 0.3),                                      # nearly equal floats
+    (np.arange(4.0), np.arange(4.0).reshape(2, 2)),        # same bytes, different shape
+    (np.arange(4.0), np.arange(4, dtype=np.int64)),        # different dtype
+    (np.zeros(3), np.array([0.0, 0.0, 1e-300])),           # one differing element
+])
+def test_distinct_inputs_do_not_collide(a, b):
+    assert memo._key(a) != memo._key(b)
+
+    m = memo.MemoizedFunction(lambda x: np.asarray(x, dtype=float) * 2 + np.size(x))
+    m(a)
+    m(b)
+    assert m.info()["misses"] == 2
+
+
+def test_scalar_kinds_share_a_key():
+    assert memo._key(1.5) == memo._key(np.float64(1.5)) == memo._key(np.array(1.5))
+
+
+def test_cached_arrays_are_read_only_copies():
+    m = memo.MemoizedFunction(lambda x: x)  # returns a view of its input
+    x = np.arange(3.0)
+    y = m(x)
+    x[0] = 99.0
+
+    assert y[0] == 0.0
+    with pytest.raises(ValueError):
+        y[0] = 1.0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    m = memo.MemoizedFunction(lambda x: np.asarray(x, dtype=float), max_entries=2)
+    for v in (1.0, 2.0, 3.0):
+        m(v)
+    assert len(m) == 2
+
+    m = memo.MemoizedFunction(lambda x: np.asarray(x, dtype=float), max_bytes=1000)
+    m(np.zeros(100))  # 800 bytes
+    m(np.ones(100))   # evicts the first
+    m(np.zeros(200))  # larger than the limit: not cached
+    assert len(m) == 1
+    assert m.info()["bytes"] == 800
+
+
+def test_shared_returns_one_function_per_expression():
+    memo.clear()
+    f = memo.shared("x**2")
+    assert memo.shared("x**2") is f
+    assert f(3.0) == 9.0
+
+
+def test_shared_caches_split_one_byte_budget(monkeypatch):
+    monkeypatch.setitem(memo.config, "max_bytes", 32_000)
+    monkeypatch.setitem(memo.config, "max_shared", 4)
+    memo.clear()
+
+    funcs = [memo.shared(f"x + {i}") for i in range(6)]
+    for f in funcs:
+        f(np.linspace(0.0, 1.0, 500))  # 4000 bytes each: fits the 8000-byte share
+        f(np.linspace(0.0, 2.0, 500))
+        f(np.linspace(0.0, 3.0, 500))  # evicts the oldest array of this formula
+
+    assert all(f.max_bytes == 8000 and f.info()["bytes"] == 8000 for f in funcs)
+    assert len(memo._shared) == 4
+    assert sum(f.info()["bytes"] for f in memo._shared.values()) <= memo.config["max_bytes"]
+    memo.clear()
@@ -0,0 +1,82 @@
+import cProfile
+
+import numpy as np
+import pytest
+
+import profiling
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setitem(profiling.config, "enabled", True)
+    profiling.reset()
+    yield
+    profiling.reset()
+
+
+def _busy_work():
+    return float(np.sort(np.random.default_rng(0).random(20_000)).sum())
+
+
+def _run(label):
+    action = profiling.begin(label)
+    with profiling.profile(action):
+        _busy_work()
+    profiling.finish(action)
+
+
+def test_disabled_records_nothing(monkeypatch):
+    monkeypatch.setitem(profiling.config, "enabled", False)
+    action = profiling.begin("Screen: Button")
+    with profiling.profile(action):
+        _busy_work()
+    profiling.finish(action)
+
+    assert action is None
+    assert profiling.actions() == {}
+
+
+def test_actions_and_histogram():
+    for _ in range(3):
+        _run("Integration: Simpson's 1/3 Rule")
+
+    stats = profiling.actions()["Integration: Simpson's 1/3 Rule"]
+    assert stats["count"] == 3
+    assert stats["unprofiled"] == 0
+    assert 0 < stats["p50"] <= stats["max"]
+
+    bins = profiling.histogram("Integration: Simpson's 1/3 Rule")
+    assert len(bins) == len(profiling.LATENCY_BINS) - 1
+    assert sum(count for _, _, count in bins) == 3
+
+
+def test_hot_functions_and_breakdown():
+    _run("Differentiation: Central")
+
+    rows = profiling.hot_functions(top=50)
+    assert any("_busy_work" in row["function"] and row["library"] == "app" for row in rows)
+    assert "numpy" in profiling.breakdown()
+    assert profiling.hot_functions("Unknown: Action") == []
+
+
+def test_export_writes_prof_files(tmp_path):
+    _run("Interpolation: Lagrange")
+    _run("Error: Export CSV")
+
+    paths = profiling.export(tmp_path)
+    assert sorted(p.name for p in paths) == ["all.prof", "error_export_csv.prof", "interpolation_lagrange.prof"]
+    assert all(p.stat().st_size > 0 for p in paths)
+
+
+def test_action_without_profiler_is_counted(monkeypatch):
+    class Busy(cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(profiling.cProfile, "Profile", Busy)
+    _run("Cooling: Estimate")
+
+    stats = profiling.actions()["Cooling: Estimate"]
+    assert stats["count"] == 1
+    assert stats["unprofiled"] == 1
+    assert profiling.hot_functions("Cooling: Estimate") == []
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+import simulation
+
+
+@pytest.fixture
+def ensemble():
+    rng = np.random.default_rng(1)
+    n = 200
+    return rng.uniform(0.005, 0.05, n), rng.uniform(15, 25, n), rng.uniform(60, 100, n)
+
+
+@pytest.mark.parametrize("method, tol", [("rk4", 1e-5), ("rk45", 1e-4)])
+def test_matches_the_analytic_solution(ensemble, method, tol):
+    k, ambient, T0 = ensemble
+    t = np.linspace(0.0, 300.0, 301)
+    sim = simulation.simulate(k, ambient, T0, t, method=method)
+
+    assert sim["data"].shape == (len(t), 1 + len(k))
+    np.testing.assert_allclose(sim["T"], simulation.analytic(t, k, ambient, T0), atol=tol)
+    np.testing.assert_array_equal(sim["t"], t)
+
+
+def test_rk45_lands_on_every_output_time_with_few_steps(ensemble):
+    t = np.linspace(0.0, 300.0, 7)
+    sim = simulation.simulate(*ensemble, t, method="rk45")
+    assert sim["steps"] < 200
+    np.testing.assert_array_equal(sim["t"], t)
+
+
+def test_rk4_splits_sparse_output_intervals():
+    k, ambient, T0 = [0.005, 0.05], 20.0, 90.0
+    t = np.linspace(0.0, 600.0, 11)  # k Δt = 3 for the second body: unstable as one step
+    sim = simulation.simulate(k, ambient, T0, t, method="rk4")
+
+    np.testing.assert_allclose(sim["T"], simulation.analytic(t, k, ambient, T0), atol=0.01)
+    assert sim["steps"] == 10 * 6
+
+    coarse = simulation.rk4(simulation.newton_cooling(k, ambient), [T0, T0], t)
+    assert coarse["steps"] == 10 and coarse["T"][-1, 1] > 1000
+
+
+def test_memory_mapped_output_and_body(tmp_path, ensemble):
+    t = np.linspace(0.0, 60.0, 61)
+    path = tmp_path / "runs.npy"
+    sim = simulation.simulate(*ensemble, t, method="rk4", out=str(path))
+
+    saved = np.load(path)
+    np.testing.assert_array_equal(saved, sim["data"])
+    t_body, T_body = simulation.body(sim, 3)
+    np.testing.assert_array_equal(T_body, saved[:, 4])
+    assert simulation.interpolant(sim, 3)(t_body[10]) == T_body[10]
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        simulation.simulate(0.1, 20.0, 90.0, [0.0, 2.0, 1.0])
+    with pytest.raises(ValueError):
+        simulation.simulate(0.1, 20.0, 90.0, [0.0, 1.0], method="euler")
+    with pytest.raises(ValueError):
+        simulation.simulate(0.1, 20.0, 90.0, [0.0, 1.0], out=np.empty((3, 2)))
@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+import utils
+
+
+def test_history_is_a_bounded_ring_buffer():
+    history = utils.ResultsHistory(capacity=3)
+    for i in range(5):
+        history.record("central", 1.0, 1.0 + i)
+
+    assert len(history) == 3
+    assert list(history.columns()["approx"]) == [3.0, 4.0, 5.0]
+    assert history.latest()["approx"] == 5.0
+
+
+def test_interpolation_records_name_their_reference():
+    history = utils.ResultsHistory()
+    history.record("newton", 82.5, 82.5, n=4)
+    latest = history.latest()
+
+    assert latest["reference"] == "Lagrange"
+    assert latest["description"] == "Lagrange vs Divided Differences (interpolation)"
+    assert history.summary()["methods"]["Divided Differences (interpolation)"]["count"] == 1
+
+
+def test_interpolation_cross_checks_stay_out_of_overall_statistics():
+    history = utils.ResultsHistory()
+    history.record("lagrange", 82.5, 82.5)
+    assert "abs_error_percentiles" not in history.summary()
+
+    history.record("central", 2.0, 2.5)
+    summary = history.summary()
+    assert summary["abs_error_percentiles"][50] == 0.5
+    assert summary["abs_error_histogram"] == {-1: 1}
+    assert summary["exact_matches"] == 0
+    assert summary["methods"]["Lagrange (interpolation)"]["max_abs_error"] == 0.0
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        utils.ResultsHistory().record("nope", 1.0, 1.0)
+
+
+def test_relative_error_needs_nonzero_exact():
+    assert math.isclose(utils.relative_error(1.1, 1.0), 0.1)
+    with pytest.raises(ValueError):
+        utils.relative_error(1.0, 0.0)
@@ -1,9 +1,32 @@
 # utils.py
-latest_results = {
-    "method_a": None,
-    "method_b": None,
-    "description": ""
-}
+import csv
+import math
+import threading
+import time
+
+import numpy as np
+
+# (method id, display label) of every numerical method whose results are recorded
+METHODS = (
+    ("backward", "Backward Divided Difference"),
+    ("forward", "Forward Divided Difference"),
+    ("central", "Central Divided Difference"),
+    ("trapezoid_points", "Trapezoidal Rule (points)"),
+    ("simpson_points", "Simpson's 1/3 Rule (points)"),
+    ("trapezoid", "Trapezoidal Rule (function)"),
+    ("simpson", "Simpson's 1/3 Rule (function)"),
+    ("newton", "Divided Differences (interpolation)"),
+    ("lagrange", "Lagrange (interpolation)"),
+)
+METHOD_IDS = {key: i for i, (key, _) in enumerate(METHODS)}
+
+# Reference of the methods not compared with a symbolic result: interpolation has no
+# exact value, so each formulation of the polynomial is checked against the other.
+# These cross-checks are left out of the overall error statistics.
+REFERENCES = {"newton": "Lagrange", "lagrange": "Divided Differences"}
+
+HISTORY_FIELDS = ("timestamp", "method", "exact", "approx", "h", "n", "runtime")
+
 
 def absolute_error(approx, exact):
     """Calculate the absolute error between an approximate and exact value."""
@@ -13,4 +36,162 @@ def relative_error(approx, exact):
     """Calculate the relative error between an approximate and exact value."""
     if exact == 0:
         raise ValueError("Exact value cannot be zero for relative error calculation.")
-    return abs((approx - exact) / exact)
\ No newline at end of file
+    return abs((approx - exact) / exact)
+
+
+class ResultsHistory:
+    """Bounded ring buffer of (exact, approximate) result pairs used by Error Analysis.
+
+    Columns are preallocated NumPy arrays; once `capacity` records are stored the oldest
+    ones are overwritten. Records can also be streamed to a CSV log (one row per record).
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.method = np.zeros(capacity, dtype=np.int8)
+        self.exact = np.zeros(capacity, dtype=np.float64)
+        self.approx = np.zeros(capacity, dtype=np.float64)
+        self.h = np.full(capacity, np.nan, dtype=np.float64)
+        self.n = np.zeros(capacity, dtype=np.int64)
+        self.runtime = np.full(capacity, np.nan, dtype=np.float64)
+
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._log = None
+        self._log_writer = None
+
+    def __len__(self):
+        return self._count
+
+    def record(self, method: str, exact: float, approx: float, h=math.nan, n: int = 0, runtime=math.nan) -> None:
+        """Store one result pair; `method` is a key of METHOD_IDS."""
+        if method not in METHOD_IDS:
+            raise ValueError(f"Unknown method '{method}'")
+
+        with self._lock:
+            i = self._next
+            self.timestamp[i] = time.time()
+            self.method[i] = METHOD_IDS[method]
+            self.exact[i] = exact
+            self.approx[i] = approx
+            self.h[i] = h
+            self.n[i] = n
+            self.runtime[i] = runtime
+
+            self._next = (i + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+            if self._log_writer is not None:
+                self._log_writer.writerow(self._row(i))
+                self._log.flush()
+
+    def latest(self):
+        """The most recent record as a dict (with 'label', 'reference' and 'description'), or None."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            row = dict(zip(HISTORY_FIELDS, self._row((self._next - 1) % self.capacity)))
+
+        label = METHODS[METHOD_IDS[row["method"]]][1]
+        row["label"] = label
+        row["reference"] = REFERENCES.get(row["method"], "Symbolic")
+        row["description"] = f"{row['reference']} vs {label}"
+        return row
+
+    def columns(self) -> dict:
+        """Copies of all stored columns in chronological order."""
+        with self._lock:
+            if self._count < self.capacity:
+                order = np.arange(self._count)
+            else:
+                order = np.roll(np.arange(self.capacity), -self._next)
+            return {field: getattr(self, field)[order] for field in HISTORY_FIELDS}
+
+    def summary(self) -> dict:
+        """Vectorized error statistics over the whole history, overall and per method.
+
+        The overall percentiles and histogram only cover results with an exact
+        reference; the REFERENCES cross-checks appear in the per-method table.
+        """
+        cols = self.columns()
+        abs_err = np.abs(cols["approx"] - cols["exact"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rel_err = np.where(cols["exact"] != 0, abs_err / np.abs(cols["exact"]), np.nan)
+
+        summary = {"count": len(abs_err), "methods": {}}
+        if len(abs_err) == 0:
+            return summary
+
+        exact = ~np.isin(cols["method"], [METHOD_IDS[key] for key in REFERENCES])
+        if np.any(exact):
+            abs_exact, rel_exact = abs_err[exact], rel_err[exact]
+            summary["abs_error_percentiles"] = dict(zip((50, 90, 99), np.percentile(abs_exact, [50, 90, 99])))
+            if np.any(~np.isnan(rel_exact)):
+                summary["rel_error_percentiles"] = dict(zip((50, 90, 99), np.nanpercentile(rel_exact, [50, 90, 99])))
+
+            # Decade histogram of the non-zero absolute errors
+            nonzero = abs_exact[abs_exact > 0]
+            if len(nonzero):
+                decades = np.floor(np.log10(nonzero)).astype(int)
+                exponents, counts = np.unique(decades, return_counts=True)
+                summary["abs_error_histogram"] = dict(zip(exponents.tolist(), counts.tolist()))
+            summary["exact_matches"] = int(np.count_nonzero(abs_exact == 0))
+
+        counts = np.bincount(cols["method"], minlength=len(METHODS))
+        for method_id in np.flatnonzero(counts):
+            mask = cols["method"] == method_id
+            rel = rel_err[mask]
+            summary["methods"][METHODS[method_id][1]] = {
+                "count": int(counts[method_id]),
+                "median_abs_error": float(np.median(abs_err[mask])),
+                "max_abs_error": float(np.max(abs_err[mask])),
+                "mean_rel_error": float(np.nanmean(rel)) if np.any(~np.isnan(rel)) else math.nan,
+                "mean_runtime": float(np.nanmean(cols["runtime"][mask])) if np.any(~np.isnan(cols["runtime"][mask])) else math.nan,
+            }
+        return summary
+
+    def export(self, path) -> str:
+        """Write the whole history to a CSV file and return its path."""
+        cols = self.columns()
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(HISTORY_FIELDS)
+            for i in range(len(cols["method"])):
+                writer.writerow(self._format(*(cols[field][i] for field in HISTORY_FIELDS)))
+        return str(path)
+
+    def log_to(self, path) -> None:
+        """Append every future record to a CSV file as it is stored (None stops logging)."""
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = self._log_writer = None
+            if path is None:
+                return
+
+            new_file = not _file_has_data(path)
+            self._log = open(path, "a", newline="", encoding="utf-8")
+            self._log_writer = csv.writer(self._log)
+            if new_file:
+                self._log_writer.writerow(HISTORY_FIELDS)
+
+    def _row(self, i):
+        return self._format(*(getattr(self, field)[i] for field in HISTORY_FIELDS))
+
+    @staticmethod
+    def _format(timestamp, method, exact, approx, h, n, runtime):
+        return (float(timestamp), METHODS[int(method)][0], float(exact), float(approx),
+                float(h), int(n), float(runtime))
+
+
+def _file_has_data(path) -> bool:
+    try:
+        with open(path, "rb") as fh:
+            return bool(fh.read(1))
+    except FileNotFoundError:
+        return False
+